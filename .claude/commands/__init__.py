@@ -2,9 +2,41 @@
 Command modules for claude-slash CLI.
 
 This package contains all command implementations that can be automatically
-discovered and registered with the CLI application.
+discovered and registered with the CLI application. Commands are registered
+lazily by ``"module:attr"`` target so that only the dispatched command's
+module is imported.
 """
 
-from .base import BaseCommand
+from . import _registry as registry
 
-__all__ = ["BaseCommand"]
+registry.register(
+    "example",
+    "Example command to test command discovery system.",
+    ".example:ExampleCommand",
+)
+registry.register(
+    "slash",
+    "Show help and available commands or update to latest release.",
+    ".slash:SlashCommand",
+)
+registry.register(
+    "menuconfig",
+    "Interactive menuconfig-style editor for CLAUDE.md files.",
+    ".menuconfig:MenuconfigCommand",
+)
+registry.register(
+    "github-init",
+    "Initialize a new GitHub repository with best practices.",
+    ".github_init:GitHubInitCommand",
+)
+
+__all__ = ["BaseCommand", "registry"]
+
+
+def __getattr__(name):
+    """Import ``BaseCommand`` only when it is first accessed."""
+    if name == "BaseCommand":
+        from .base import BaseCommand
+
+        return BaseCommand
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
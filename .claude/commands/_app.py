@@ -0,0 +1,111 @@
+"""
+Root Typer application plumbing for claude-slash CLI commands.
+
+Command wrappers no longer catch their own exceptions. Instead, the root
+application uses ``CommandGroup``, which reports any unexpected error from
+the invoked subcommand once, in a single place, and exits with status 1.
+
+``CommandGroup`` also serves every command in the lazy registry. Registry
+commands are listed from their registered help alone; a command's module is
+imported, and its class instantiated, only when that command is parsed,
+invoked or asked for its own help.
+"""
+
+from typing import List, Optional
+
+import click
+import typer
+from typer.core import TyperGroup
+
+from . import _registry as registry
+from .base import BaseCommand
+
+_ERROR_TEMPLATE = "[bold red]Error executing {}:[/bold red] {}"
+
+
+class LazyCommand(click.Command):
+    """Click command proxy that loads the real command on first use."""
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, short_help=help)
+        self._real: Optional[click.Command] = None
+
+    def _load(self) -> click.Command:
+        """Import the command module and build its Click command once."""
+        if self._real is None:
+            app = typer.Typer(add_completion=False)
+            app.command(self.name)(registry.get_typer(self.name))
+            self._real = typer.main.get_command(app)
+        return self._real
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self._load().make_context(info_name, args, parent=parent, **extra)
+
+    def invoke(self, ctx: click.Context):
+        return self._load().invoke(ctx)
+
+    def get_params(self, ctx: click.Context):
+        return self._load().get_params(ctx)
+
+    def get_usage(self, ctx: click.Context) -> str:
+        return self._load().get_usage(ctx)
+
+    def get_help(self, ctx: click.Context) -> str:
+        return self._load().get_help(ctx)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str):
+        return self._load().shell_complete(ctx, incomplete)
+
+
+class CommandGroup(TyperGroup):
+    """Typer group that serves registry commands and formats their errors."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List directly added commands followed by registry commands."""
+        names = list(super().list_commands(ctx))
+        names.extend(name for name in registry.names() if name not in self.commands)
+        return names
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a command, creating a lazy proxy for registry entries."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            try:
+                entry = registry.get_entry(cmd_name)
+            except KeyError:
+                return None
+            command = LazyCommand(entry.name, entry.help)
+            self.add_command(command)
+        return command
+
+    def invoke(self, ctx: click.Context):
+        """Invoke the selected subcommand, reporting unexpected errors."""
+        try:
+            return super().invoke(ctx)
+        except (click.exceptions.Exit, click.ClickException, click.Abort):
+            # Normal exits, usage errors and aborts are handled by Click
+            raise
+        except Exception as e:
+            BaseCommand._get_console().print(
+                _ERROR_TEMPLATE.format(ctx.invoked_subcommand, e)
+            )
+            raise typer.Exit(1)
+
+
+def create_app(**kwargs) -> typer.Typer:
+    """
+    Create the root Typer application with centralized error handling.
+
+    Every command in the registry is available on the returned app without
+    being imported up front.
+
+    Args:
+        **kwargs: Extra arguments passed through to ``typer.Typer``
+
+    Returns:
+        A Typer application whose subcommands share one error handler
+    """
+    app = typer.Typer(cls=CommandGroup, **kwargs)
+    # Ensure Typer builds a group even when no command is added directly
+    app.callback()(lambda: None)
+    return app
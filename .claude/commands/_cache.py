@@ -0,0 +1,39 @@
+"""
+Best-effort on-disk cache shared by claude-slash commands.
+
+Entries are small text files under ``$XDG_CACHE_HOME/perses-llm-d`` whose
+modification time records when they were written. Reads and writes never
+raise: a missing, stale or unwritable cache simply means doing the work again.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+
+def cache_dir() -> Path:
+    """Return the per-user cache directory for templates and lookups."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "perses-llm-d"
+
+
+def read_cache(name: str, ttl: float) -> Optional[str]:
+    """Return a cache entry younger than ``ttl`` seconds, or None."""
+    cache_file = cache_dir() / name
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+
+def write_cache(name: str, content: str) -> None:
+    """Store a cache entry; caching is best-effort, so failures are ignored."""
+    cache_file = cache_dir() / name
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(content, encoding="utf-8")
+    except OSError:
+        pass
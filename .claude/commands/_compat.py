@@ -0,0 +1,8 @@
+"""
+Python version compatibility shims shared by claude-slash commands.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
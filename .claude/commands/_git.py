@@ -0,0 +1,30 @@
+"""
+Git repository helpers shared by claude-slash commands.
+
+Repository roots are found by walking up the directory tree instead of running
+``git rev-parse``, which costs a process spawn per lookup.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def find_git_root(start: str) -> Optional[Path]:
+    """
+    Find the repository root containing ``start`` by looking for ``.git``.
+
+    ``.git`` may be a directory or, in worktrees and submodules, a file.
+
+    Args:
+        start: Directory to start from, usually ``os.getcwd()``
+
+    Returns:
+        The repository root, or None outside a repository
+    """
+    path = Path(start).resolve()
+    for directory in (path, *path.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
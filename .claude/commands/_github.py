@@ -0,0 +1,221 @@
+"""
+Minimal GitHub API client shared by claude-slash commands.
+
+Talks to the REST and GraphQL endpoints of ``api.github.com`` directly over
+persistent HTTPS connections, instead of spawning a ``gh`` process (and a
+fresh TLS handshake) per request. Each thread keeps its own connection, so a
+client can be shared by concurrently running setup steps. The token comes
+from ``GITHUB_TOKEN`` / ``GH_TOKEN`` or, failing that, from ``gh auth token``.
+
+Payloads are encoded and decoded with ``orjson`` when it is installed, falling
+back to the standard library ``json`` module otherwise.
+"""
+
+import http.client
+import json
+import os
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+API_HOST = "api.github.com"
+
+# Methods that are safe to resend after a request may have reached the server
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize UTF-8 encoded JSON without decoding it to ``str`` first."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class GitHubAPIError(RuntimeError):
+    """Raised when a GitHub API request fails."""
+
+    def __init__(self, status: Optional[int], message: str):
+        self.status = status
+        prefix = f"HTTP {status}: " if status is not None else ""
+        super().__init__(f"{prefix}{message}")
+
+
+class GitHubConnectionError(GitHubAPIError):
+    """Raised when a request fails in transport, before any HTTP status."""
+
+    def __init__(self, message: str):
+        super().__init__(None, message)
+
+
+def get_token() -> Optional[str]:
+    """Return a GitHub token from the environment or the gh CLI, if any."""
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+    try:
+        output = subprocess.check_output(
+            ["gh", "auth", "token"], stderr=subprocess.DEVNULL, encoding="utf-8"
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return output.strip() or None
+
+
+class GitHubAPI:
+    """GitHub REST/GraphQL client over keep-alive HTTPS connections."""
+
+    def __init__(self, token: str, host: str = API_HOST):
+        self._host = host
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "claude-slash",
+        }
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[http.client.HTTPSConnection] = []
+        # Connected by warm() and not yet claimed by a thread
+        self._idle: List[http.client.HTTPSConnection] = []
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON response.
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. ``/user``
+            body: JSON-serializable request body
+            headers: Extra headers for this request
+
+        Returns:
+            Decoded JSON, or None for an empty or non-JSON response body
+
+        Raises:
+            GitHubConnectionError: If the connection fails
+            GitHubAPIError: If the request returns an error status
+        """
+        payload = dumps(body) if body is not None else None
+        request_headers = dict(self._headers)
+        if payload is not None:
+            request_headers["Content-Type"] = "application/json"
+        if headers:
+            request_headers.update(headers)
+
+        # Retry once on a fresh connection if the kept-alive one was dropped.
+        # A POST or PATCH is only resent when the server closed the connection
+        # without answering; after a timeout it may already have been applied.
+        for attempt in range(2):
+            conn = self._connection()
+            sent = False
+            try:
+                conn.request(method, path, body=payload, headers=request_headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                self._drop_connection()
+                retry = (
+                    not sent
+                    or method in _IDEMPOTENT_METHODS
+                    or isinstance(e, http.client.RemoteDisconnected)
+                )
+                if attempt or not retry:
+                    raise GitHubConnectionError(str(e)) from e
+
+        # Error pages (e.g. an HTML 502) are not JSON, so the status is checked
+        # before the body is decoded
+        is_json = "json" in (response.getheader("Content-Type") or "")
+        if response.status >= 400:
+            message = response.reason
+            try:
+                decoded = loads(data) if is_json and data else None
+            except ValueError:
+                decoded = None
+            if isinstance(decoded, dict) and decoded.get("message"):
+                message = decoded["message"]
+            raise GitHubAPIError(response.status, message)
+
+        if not is_json or not data:
+            return None
+        try:
+            return loads(data)
+        except ValueError as e:
+            raise GitHubAPIError(response.status, f"Invalid JSON response: {e}") from e
+
+    def warm(self) -> None:
+        """
+        Open a connection ahead of the first request.
+
+        Meant to run on a background thread: the TCP and TLS handshakes then
+        overlap other work, and the next thread that needs a connection takes
+        this one over instead of opening its own. Failures are ignored; the
+        request path simply opens a connection as usual.
+        """
+        conn = http.client.HTTPSConnection(self._host, timeout=30)
+        with self._lock:
+            # Registered first so close() can interrupt a pending handshake
+            self._connections.append(conn)
+        try:
+            conn.connect()
+        except OSError:
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+            conn.close()
+            return
+        with self._lock:
+            if conn in self._connections:
+                self._idle.append(conn)
+
+    def close(self) -> None:
+        """Close the connections opened by every thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._idle = []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        """Return the calling thread's connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = http.client.HTTPSConnection(self._host, timeout=30)
+                with self._lock:
+                    self._connections.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        """Close and forget the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
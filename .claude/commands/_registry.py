@@ -0,0 +1,64 @@
+"""
+Lazy command registry for claude-slash CLI commands.
+
+Commands are registered by name against a ``"module:attr"`` target string
+instead of an imported class, so that a command module (and everything it
+imports) is only loaded when that command is actually dispatched.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Type
+
+if TYPE_CHECKING:
+    from .base import CommandProtocol
+
+
+class CommandEntry(NamedTuple):
+    """A registered command: its short help and lazy import target."""
+
+    name: str
+    help: str
+    target: str
+
+
+_COMMANDS: Dict[str, CommandEntry] = {}
+
+
+def register(name: str, help: str, target: str) -> None:
+    """
+    Register a command without importing it.
+
+    Args:
+        name: Command name as exposed on the CLI
+        help: Short help shown in command listings
+        target: ``"module:attr"`` path; relative modules resolve against
+            this package (e.g. ``".example:ExampleCommand"``)
+    """
+    if ":" not in target:
+        raise ValueError(f"Invalid command target {target!r}, expected 'module:attr'")
+    _COMMANDS[name] = CommandEntry(name, help, target)
+
+
+def names() -> List[str]:
+    """Return the registered command names in registration order."""
+    return list(_COMMANDS)
+
+
+def get_entry(name: str) -> CommandEntry:
+    """Return the registry entry for a command name."""
+    try:
+        return _COMMANDS[name]
+    except KeyError:
+        raise KeyError(f"Unknown command: {name}") from None
+
+
+def load(name: str) -> Type["CommandProtocol"]:
+    """Import and return the command class registered under ``name``."""
+    module_name, attr = get_entry(name).target.split(":", 1)
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, attr)
+
+
+def get_typer(name: str) -> Callable[..., None]:
+    """Instantiate the named command and return its Typer callable."""
+    return load(name)().create_typer_command()
@@ -1,49 +1,185 @@
 """
 Base command interface for claude-slash CLI commands.
 
-This module defines the BaseCommand abstract base class that all commands
-should inherit from to ensure consistent behavior and type safety.
+This module defines the BaseCommand base class that all commands should
+inherit from to ensure consistent behavior and type safety, and the
+CommandProtocol used to type command classes in registries.
+
+Typer and the Rich-backed ``..ui`` helpers are imported lazily, on first use,
+so that importing a command module stays cheap on the ``--help`` fast path.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Optional
+from __future__ import annotations
+
+import functools
+import os
+import re
+import sys
+import types
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Protocol, Tuple
+
+if TYPE_CHECKING:
+    from typing import Callable, ClassVar, List, Union
+
+# Markup prefixes for single-line messages; the ..ui format_* helpers are
+# only needed when a message carries extra details.
+_ERROR_PREFIX = "[bold red]Error:[/bold red] "
+_SUCCESS_PREFIX = "[bold green]Success:[/bold green] "
+_INFO_PREFIX = "[bold blue]Info:[/bold blue] "
+_WARNING_PREFIX = "[bold yellow]Warning:[/bold yellow] "
+
+# Plain-text labels written in place of the prefixes on the fast output path
+_PLAIN_PREFIXES = {
+    _SUCCESS_PREFIX: "Success: ",
+    _INFO_PREFIX: "Info: ",
+    _WARNING_PREFIX: "Warning: ",
+}
+
+# Function metadata Typer reads from a command callback
+_WRAPPER_ATTRS = ("__name__", "__qualname__", "__doc__", "__annotations__")
+
+# Opt-in: write plain, markup-free messages straight to stdout, skipping Rich
+_FAST_OUTPUT = os.environ.get("CLAUDE_SLASH_FAST_OUTPUT") == "1"
+
+
+# Start of a Rich markup tag: a style name, closing tag, colour or event
+_MARKUP_RE = re.compile(r"\[[a-z/#@]", re.IGNORECASE)
+
+
+class Param(NamedTuple):
+    """A command-line parameter declared in ``BaseCommand.params``."""
+
+    name: str
+    default: Any
+    help: str = ""
+    annotation: Any = None  # None: the type of the default, or Optional[str]
+    flags: Tuple[str, ...] = ()  # Empty: Typer's default --name form
+    argument: bool = False  # Positional argument instead of an option
+
+
+def _run_command(self: BaseCommand, **kwargs: Any) -> None:
+    """Wrapper function to handle command execution."""
+    return self.execute(**kwargs)
+
+
+def _make_wrapper(
+    name: str, doc: str, params: List[Union[Param, Tuple[Any, ...]]]
+) -> Callable[..., None]:
+    """
+    Generate a wrapper function with an explicit signature for ``params``.
+
+    The function is compiled from source so that Typer sees plain keyword
+    parameters with ``typer.Option`` (or ``typer.Argument``) defaults, and the
+    call into ``execute`` passes them by name without going through
+    ``**kwargs``.
+
+    Args:
+        name: Command name, used as the function's ``__name__``
+        doc: Help text, used as the function's ``__doc__``
+        params: ``Param`` entries or plain tuples of their fields, one per
+            parameter
+
+    Returns:
+        An unbound function taking ``self`` followed by the options
+    """
+    import typer
+
+    namespace: dict = {}
+    signature = []
+    call_args = []
+    for index, param in enumerate(Param(*entry) for entry in params):
+        if param.argument:
+            default = typer.Argument(param.default, help=param.help)
+        else:
+            default = typer.Option(param.default, *param.flags, help=param.help)
+        annotation = param.annotation
+        if annotation is None:
+            annotation = (
+                type(param.default) if param.default is not None else Optional[str]
+            )
+        namespace[f"_default_{index}"] = default
+        namespace[f"_type_{index}"] = annotation
+        signature.append(f"{param.name}: _type_{index} = _default_{index}")
+        call_args.append(f"{param.name}={param.name}")
+
+    func_name = name.replace("-", "_")
+    source = (
+        f"def {func_name}(self, *, {', '.join(signature)}) -> None:\n"
+        f"    return self.execute({', '.join(call_args)})\n"
+    )
+    # dont_inherit keeps this module's postponed annotations out of the
+    # generated code, so Typer sees real types rather than strings
+    code = compile(source, f"<command wrapper {name}>", "exec", dont_inherit=True)
+    exec(code, namespace)
 
-import typer
+    wrapper = namespace[func_name]
+    wrapper.__name__ = name
+    wrapper.__qualname__ = name
+    wrapper.__doc__ = doc
+    return wrapper
 
-from ..ui import (
-    format_error_message,
-    format_info_message,
-    format_success_message,
-    format_warning_message,
-    get_console,
-)
 
+class CommandProtocol(Protocol):
+    """Structural type for command classes, used for typing only."""
 
-class BaseCommand(ABC):
+    name: ClassVar[str]
+    help_text: ClassVar[str]
+
+    def execute(self, **kwargs: Any) -> None: ...
+
+    def create_typer_command(self) -> Callable[..., None]: ...
+
+
+class BaseCommand:
     """
-    Abstract base class for all claude-slash commands.
+    Base class for all claude-slash commands.
 
     This class provides a common interface for command implementation,
     ensuring type safety and consistent behavior across all commands.
+
+    Subclasses must set the ``name`` and ``help_text`` class attributes and
+    implement ``execute``. Subclasses that add no instance state should
+    declare ``__slots__ = ()`` so instances stay dict-free.
+    Commands can declare their options and arguments in ``params`` as
+    ``Param`` entries, or ``(name, default, help)`` tuples, instead of
+    overriding ``create_typer_command``.
     """
 
-    def __init__(self):
-        """Initialize the base command with a shared console for output."""
-        self.console = get_console()
+    __slots__ = ("_typer_cmd",)
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Return the command name for registration."""
-        pass
+    name: ClassVar[str]
+    help_text: ClassVar[str]
+    params: ClassVar[List[Union[Param, Tuple[Any, ...]]]] = []
+    _wrapper_template: ClassVar[Callable[..., None]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Validate that subclasses declare their name, help text and execute."""
+        super().__init_subclass__(**kwargs)
+        for attr in ("name", "help_text"):
+            value = getattr(cls, attr, None)
+            if not isinstance(value, str) or not value:
+                raise TypeError(
+                    f"{cls.__name__}.{attr} must be a non-empty string class attribute"
+                )
+        if cls.execute is BaseCommand.execute:
+            raise TypeError(f"{cls.__name__} must implement execute()")
+
+    @classmethod
+    def _get_console(cls):
+        """Return the console shared by all commands, creating it on first use."""
+        console = BaseCommand.__dict__.get("_console_cached")
+        if console is None:
+            from ..ui import get_console
+
+            console = get_console()
+            BaseCommand._console_cached = console
+        return console
 
     @property
-    @abstractmethod
-    def help_text(self) -> str:
-        """Return the help text for the command."""
-        pass
+    def console(self):
+        """Return the shared Rich console."""
+        return self._get_console()
 
-    @abstractmethod
     def execute(self, **kwargs: Any) -> None:
         """
         Execute the command with the given arguments.
@@ -51,48 +187,97 @@ class BaseCommand(ABC):
         Args:
             **kwargs: Command arguments passed from Typer
         """
-        pass
+        raise NotImplementedError
+
+    @classmethod
+    def _get_wrapper_template(cls) -> Callable[..., None]:
+        """
+        Return the class's Typer wrapper template, building it on first use.
+
+        The template carries the command name and help text, so instances only
+        need to bind it. Options in ``params`` get a generated signature;
+        without them, the template is a renamed copy of ``_run_command``.
+        """
+        template = cls.__dict__.get("_wrapper_template")
+        if template is None:
+            if cls.params:
+                template = _make_wrapper(cls.name, cls.help_text, cls.params)
+            else:
+                template = types.FunctionType(
+                    _run_command.__code__, _run_command.__globals__, cls.name
+                )
+                template.__qualname__ = cls.name
+                template.__doc__ = cls.help_text
+            cls._wrapper_template = template
+        return template
 
     def create_typer_command(self):
         """
         Create a Typer command function for this command.
 
-        This method should be overridden by subclasses that need
+        Options declared in ``params`` are exposed through a generated
+        wrapper signature. This method should be overridden by subclasses that need
         custom argument parsing or command structure.
 
         Returns:
             A callable function that can be registered with Typer
         """
+        cached = getattr(self, "_typer_cmd", None)
+        if cached is not None:
+            return cached
 
-        def command_wrapper(**kwargs) -> None:
-            """Wrapper function to handle command execution."""
-            try:
-                self.execute(**kwargs)
-            except Exception as e:
-                self.console.print(
-                    f"[bold red]Error executing {self.name}:[/bold red] " f"{str(e)}"
-                )
-                raise typer.Exit(1)
-
-        # Set the function name and docstring for better help text
-        command_wrapper.__name__ = self.name
-        command_wrapper.__doc__ = self.help_text
+        # Bind with a C-level partial instead of a closure; the template
+        # already carries the command name, help text and annotations
+        template = type(self)._get_wrapper_template()
+        command_wrapper = functools.partial(template, self)
+        for attr in _WRAPPER_ATTRS:
+            setattr(command_wrapper, attr, getattr(template, attr))
 
+        self._typer_cmd = command_wrapper
         return command_wrapper
 
+    def _print_line(self, prefix: str, message: str) -> None:
+        """Print a single-line message, bypassing Rich for plain text if enabled."""
+        if _FAST_OUTPUT and not _MARKUP_RE.search(message):
+            sys.stdout.write(_PLAIN_PREFIXES[prefix] + message + "\n")
+            return
+        self.console.print(f"{prefix}{message}")
+
     def error(self, message: str, details: Optional[str] = None) -> None:
         """Print an error message and exit."""
-        self.console.print(format_error_message(message, details))
+        import typer
+
+        if details is None:
+            self.console.print(f"{_ERROR_PREFIX}{message}")
+        else:
+            from ..ui import format_error_message
+
+            self.console.print(format_error_message(message, details))
         raise typer.Exit(1)
 
     def success(self, message: str, details: Optional[str] = None) -> None:
         """Print a success message."""
+        if details is None:
+            self._print_line(_SUCCESS_PREFIX, message)
+            return
+        from ..ui import format_success_message
+
         self.console.print(format_success_message(message, details))
 
     def info(self, message: str, details: Optional[str] = None) -> None:
         """Print an informational message."""
+        if details is None:
+            self._print_line(_INFO_PREFIX, message)
+            return
+        from ..ui import format_info_message
+
         self.console.print(format_info_message(message, details))
 
     def warning(self, message: str, details: Optional[str] = None) -> None:
         """Print a warning message."""
+        if details is None:
+            self._print_line(_WARNING_PREFIX, message)
+            return
+        from ..ui import format_warning_message
+
         self.console.print(format_warning_message(message, details))
@@ -5,61 +5,48 @@ This module provides a simple example command that can be automatically
 discovered and registered with the CLI application.
 """
 
-from typing import Any
+from __future__ import annotations
 
-import typer
+from typing import TYPE_CHECKING
 
 from .base import BaseCommand
 
+if TYPE_CHECKING:
+    from typing import Any
+
+_DEFAULT_MESSAGE = "Hello, World!"
+
+_EXAMPLE_HELP = """\
+Example command to test command discovery system with Rich formatting.
+
+Examples:
+  /example                           # Default hello message
+  /example --message "Custom text"   # Custom message
+  claude-slash example               # CLI mode
+
+This command demonstrates:
+• BaseCommand inheritance
+• Custom argument handling
+• Rich-formatted success messages"""
+
 
 class ExampleCommand(BaseCommand):
     """
     Example command for testing the command discovery system.
     """
 
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "example"
+    __slots__ = ()
 
-    @property
-    def help_text(self) -> str:
-        """Return the help text for the command."""
-        return (
-            "Example command to test command discovery system with Rich formatting.\n\n"
-            "Examples:\n"
-            "  /example                           # Default hello message\n"
-            '  /example --message "Custom text"   # Custom message\n'
-            "  claude-slash example               # CLI mode\n\n"
-            "This command demonstrates:\n"
-            "• BaseCommand inheritance\n"
-            "• Custom argument handling\n"
-            "• Rich-formatted success messages"
-        )
+    name = "example"
+    help_text = _EXAMPLE_HELP
+    params = [("message", _DEFAULT_MESSAGE, "Message to display")]
 
-    def execute(self, **kwargs: Any) -> None:
+    def execute(self, message: str = _DEFAULT_MESSAGE, **kwargs: Any) -> None:
         """
         Execute the example command.
 
         Args:
-            **kwargs: Command arguments passed from Typer
+            message: Message to display
+            **kwargs: Additional command arguments passed from Typer
         """
-        message = kwargs.get("message", "Hello, World!")
         self.success(f"Example command executed with message: {message}")
-
-    def create_typer_command(self):
-        """Create a Typer command with custom arguments."""
-
-        def command_wrapper(
-            message: str = typer.Option("Hello, World!", help="Message to display")
-        ) -> None:
-            """Example command to test command discovery system."""
-            try:
-                self.execute(message=message)
-            except Exception as e:
-                self.console.print(
-                    f"[bold red]Error executing {self.name}:[/bold red] {str(e)}"
-                )
-                raise typer.Exit(1)
-
-        return command_wrapper
@@ -6,163 +6,92 @@ new GitHub repositories with best practices including CI/CD workflows,
 documentation sites, and security-first defaults.
 """
 
+import asyncio
+import functools
+import http.client
+import json
 import os
+import shutil
 import subprocess
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Optional
-
-import typer
-
-from .base import BaseCommand
-
-
-@dataclass
-class GitHubInitOptions:
-    """Options for GitHub repository initialization."""
-
-    repo_name: str
-    description: Optional[str] = None
-    private: bool = True  # Default to private
-    license: Optional[str] = None
-    gitignore: Optional[str] = None
-    readme: bool = True
-    default_branch: str = "main"
-    topics: Optional[List[str]] = None
-    create_website: bool = False
-    enable_dependabot: bool = True
-    dry_run: bool = False
-
-    # GitHub Projects
-    create_project: bool = True
-    project_template: str = "development"
-
-    # Advanced GitHub Automation
-    enable_auto_version: bool = True
-    enable_auto_merge: bool = True
-    enable_claude_review: bool = False
-    enable_auto_release: bool = True
-    enable_branch_protection: bool = True
-
-
-class GitHubInitialization:
-    """Core GitHub repository initialization logic."""
-
-    def __init__(self, options: GitHubInitOptions):
-        self.options = options
-        self.original_dir = os.getcwd()
-        self.created_files = []
-
-    def execute(self) -> None:
-        """Execute the repository initialization process."""
-        if self.options.dry_run:
-            self._execute_dry_run()
-            return
-
-        # Validate prerequisites before starting
-        self._validate_prerequisites()
-
-        try:
-            print(f"🚀 Initializing GitHub repository: {self.options.repo_name}")
-
-            # Step 1: Initialize git repository
-            self._init_git_repo()
-
-            # Step 2: Create initial files
-            self._create_initial_files()
-
-            # Step 3: Create GitHub Actions workflows
-            self._create_github_workflows()
-
-            # Step 4: Initialize Docusaurus if requested
-            if self.options.create_website:
-                self._initialize_docusaurus()
-
-            # Step 5: Create GitHub repository
-            self._create_github_repo()
-
-            # Step 6: Create GitHub project if requested
-            if self.options.create_project:
-                self._create_github_project()
-
-            # Step 7: Setup dependabot
-            if self.options.enable_dependabot:
-                self._setup_dependabot()
-
-            # Step 8: Configure advanced automation
-            self._configure_automation()
-
-            # Step 9: Setup branch protection if enabled
-            if self.options.enable_branch_protection:
-                self._setup_branch_protection()
-
-            # Step 10: Initial commit and push
-            self._initial_commit_and_push()
-
-            print(f"✅ Repository '{self.options.repo_name}' initialized successfully!")
-            print(f"📂 Local directory: {os.getcwd()}")
-            print(
-                f"🔗 GitHub URL: https://github.com/{self._get_github_user()}/{self.options.repo_name}"
-            )
-
-        except Exception as e:
-            print(f"❌ Error during initialization: {e}")
-            self._rollback()
-            raise
-
-    def _validate_prerequisites(self) -> None:
-        """Validate that all prerequisites are available."""
-        # Check if gh CLI is available and authenticated
-        result = subprocess.run(
-            ["gh", "auth", "status"], capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError("GitHub CLI (gh) is not installed or not authenticated")
-
-        # Check if git is available
-        result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError("Git is not installed")
-
-        # Check if repo name already exists locally
-        if Path(self.options.repo_name).exists():
-            raise RuntimeError(f"Directory '{self.options.repo_name}' already exists")
-
-    def _get_github_user(self) -> str:
-        """Get the current GitHub username."""
-        result = subprocess.run(["gh", "api", "user"], capture_output=True, text=True)
-        if result.returncode == 0:
-            import json
-
-            user_data = json.loads(result.stdout)
-            return user_data.get("login", "unknown")
-        return "unknown"
-
-    def _init_git_repo(self) -> None:
-        """Initialize a new git repository."""
-        # Create directory and initialize git
-        os.makedirs(self.options.repo_name)
-        os.chdir(self.options.repo_name)
-
-        subprocess.run(["git", "init"], check=True)
-        subprocess.run(["git", "branch", "-M", self.options.default_branch], check=True)
-
-    def _create_initial_files(self) -> None:
-        """Create initial files for the repository."""
-        if self.options.readme:
-            self._create_readme()
-
-        if self.options.gitignore:
-            self._create_gitignore()
-
-        if self.options.license:
-            self._create_license()
-
-    def _create_readme(self) -> None:
-        """Create a README.md file."""
-        content = f"""# {self.options.repo_name}
-
-{self.options.description or ""}
+from typing import Any, Final, List, Optional, Tuple
+
+from ._cache import read_cache, write_cache
+from ._compat import DATACLASS_SLOTS
+from ._github import (
+    GitHubAPI,
+    GitHubAPIError,
+    GitHubConnectionError,
+    dumps,
+    get_token,
+    loads,
+)
+from .base import BaseCommand, Param
+
+# Public mirror of github/gitignore; file names are case-sensitive
+_GITIGNORE_URL = "https://raw.githubusercontent.com/github/gitignore/main/{}.gitignore"
+
+# Downloaded gitignore templates are kept on disk for a day between runs, the
+# authenticated user's login for an hour
+_GITIGNORE_CACHE_TTL = 24 * 60 * 60
+_USER_CACHE_TTL = 60 * 60
+
+# Rollback retries the repository delete on transient failures, backing off
+# 0.5s, then 1s between attempts
+_DELETE_ATTEMPTS = 3
+_TRANSIENT_STATUSES = frozenset({429, 502, 503, 504})
+
+# Below this many files, _fast_rmtree unlinks serially; a pool isn't worth it
+_PARALLEL_UNLINK_THRESHOLD = 64
+
+# Initial commit and push as one shell invocation; the commit message, remote
+# URL and branch are passed as positional parameters rather than interpolated
+_COMMIT_AND_PUSH_SCRIPT = (
+    'git add . && git commit -m "$1" && git remote add origin "$2" '
+    '&& git push -u origin "$3"'
+)
+
+# Fixed tail of the dry-run preview
+_DRY_RUN_FEATURES: Final[str] = """
+🎯 Outcome Management System:
+   🏷️  Hierarchical labels: outcome, epic, story
+   📋 Issue templates: outcome.md, epic.md, story.md
+   🤖 Project automation workflow
+   📊 Weekly metrics dashboard
+
+🎯 GitHub Actions workflows:
+   🚀 CI/CD pipeline
+   📋 Project automation
+   📊 Outcome metrics dashboard"""
+
+# Progress lines for the enabled automation options, printed in one write
+_AUTOMATION_MESSAGES: Final[Tuple[Tuple[str, str], ...]] = (
+    ("enable_auto_version", "🔄 Configuring automatic versioning..."),
+    ("enable_auto_merge", "🔄 Configuring auto-merge for dependabot..."),
+    ("enable_auto_release", "🔄 Configuring automatic releases..."),
+)
+
+# Label mutations are still behind the "bane" GraphQL schema preview
+_LABEL_PREVIEW_HEADERS = {"Accept": "application/vnd.github.bane-preview+json"}
+
+# Hierarchical labels for the outcome management system: (name, color, description)
+_OUTCOME_LABELS: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ("outcome", "6B46C1", "Top-level business outcomes that group related epics"),
+    ("epic", "F59E0B", "Major work items that deliver part of an outcome"),
+    ("story", "10B981", "Development tasks that implement part of an epic"),
+)
+
+# File templates written into new repositories; the README, license and docs
+# templates are filled in with str.format().
+_README_TEMPLATE: Final[str] = """# {repo_name}
+
+{description}
 
 ## Getting Started
 
@@ -174,32 +103,10 @@ Contributions are welcome! Please read our contributing guidelines.
 
 ## License
 
-{self.options.license or "See LICENSE file for details."}
+{license}
 """
-        with open("README.md", "w") as f:
-            f.write(content)
-        self.created_files.append("README.md")
 
-    def _create_gitignore(self) -> None:
-        """Create .gitignore file."""
-        # Use gh to get gitignore template if available
-        try:
-            result = subprocess.run(
-                ["gh", "api", f"/gitignore/templates/{self.options.gitignore}"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                import json
-
-                data = json.loads(result.stdout)
-                content = data.get("source", "")
-                with open(".gitignore", "w") as f:
-                    f.write(content)
-                self.created_files.append(".gitignore")
-        except Exception:
-            # Fallback to basic gitignore
-            basic_gitignore = """# Byte-compiled / optimized / DLL files
+_BASIC_GITIGNORE: Final[str] = """# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -262,17 +169,10 @@ venv.bak/
 ehthumbs.db
 Thumbs.db
 """
-            with open(".gitignore", "w") as f:
-                f.write(basic_gitignore)
-            self.created_files.append(".gitignore")
 
-    def _create_license(self) -> None:
-        """Create LICENSE file."""
-        # For simplicity, create a basic MIT license placeholder
-        # In a real implementation, you'd want to fetch the actual license text
-        content = f"""MIT License
+_MIT_LICENSE_TEMPLATE: Final[str] = """MIT License
 
-Copyright (c) 2025 {self._get_github_user()}
+Copyright (c) 2025 {owner}
 
 Permission is hereby granted, free of charge, to any person obtaining a copy
 of this software and associated documentation files (the "Software"), to deal
@@ -292,17 +192,8 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-        with open("LICENSE", "w") as f:
-            f.write(content)
-        self.created_files.append("LICENSE")
 
-    def _create_github_workflows(self) -> None:
-        """Create GitHub Actions workflows."""
-        workflows_dir = Path(".github/workflows")
-        workflows_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create a basic CI workflow
-        ci_workflow = """name: CI
+_CI_WORKFLOW: Final[str] = """name: CI
 
 on:
   push:
@@ -333,121 +224,16 @@ jobs:
       run: pytest
 """
 
-        with open(workflows_dir / "ci.yml", "w") as f:
-            f.write(ci_workflow)
-        self.created_files.append(".github/workflows/ci.yml")
-
-    def _initialize_docusaurus(self) -> None:
-        """Initialize Docusaurus documentation site."""
-        print("📚 Setting up Docusaurus documentation site...")
-        # This is a placeholder - real implementation would need Node.js setup
-        docs_dir = Path("docs")
-        docs_dir.mkdir(exist_ok=True)
-
-        with open(docs_dir / "index.md", "w") as f:
-            f.write(
-                f"""# {self.options.repo_name} Documentation
+_DOCS_INDEX_TEMPLATE: Final[str] = """# {repo_name} Documentation
 
-Welcome to the documentation for {self.options.repo_name}.
+Welcome to the documentation for {repo_name}.
 
 ## Overview
 
-{self.options.description or "Add your project description here."}
+{description}
 """
-            )
-        self.created_files.append("docs/index.md")
-
-    def _create_github_repo(self) -> None:
-        """Create the GitHub repository."""
-        visibility = "private" if self.options.private else "public"
-
-        cmd = ["gh", "repo", "create", self.options.repo_name, f"--{visibility}"]
-
-        if self.options.description:
-            cmd.extend(["--description", self.options.description])
-
-        subprocess.run(cmd, check=True)
-
-    def _create_github_project(self) -> None:
-        """Create GitHub project board with outcome management system."""
-        print("📋 Creating GitHub project with outcome management...")
-        # Repository-level project creation
-        subprocess.run(
-            [
-                "gh",
-                "project",
-                "create",
-                "--title",
-                f"{self.options.repo_name} Development",
-                "--body",
-                f"Development tracking for {self.options.repo_name}",
-            ],
-            check=True,
-        )
 
-        # Create hierarchical labels for outcome management
-        self._create_outcome_labels()
-
-        # Create issue templates for structured development
-        self._create_issue_templates()
-
-        # Create automation workflows for project management
-        self._create_project_automation()
-
-    def _create_outcome_labels(self) -> None:
-        """Create hierarchical labels for outcome management system."""
-        print("🏷️  Creating outcome management labels...")
-
-        labels = [
-            (
-                "outcome",
-                "6B46C1",
-                "Top-level business outcomes that group related epics",
-            ),
-            ("epic", "F59E0B", "Major work items that deliver part of an outcome"),
-            ("story", "10B981", "Development tasks that implement part of an epic"),
-        ]
-
-        for name, color, description in labels:
-            try:
-                subprocess.run(
-                    [
-                        "gh",
-                        "label",
-                        "create",
-                        name,
-                        "--color",
-                        color,
-                        "--description",
-                        description,
-                    ],
-                    check=True,
-                )
-            except subprocess.CalledProcessError:
-                # Label might already exist, try to update it
-                subprocess.run(
-                    [
-                        "gh",
-                        "label",
-                        "edit",
-                        name,
-                        "--color",
-                        color,
-                        "--description",
-                        description,
-                    ],
-                    check=False,
-                )  # Don't fail if update doesn't work
-
-    def _create_issue_templates(self) -> None:
-        """Create issue templates for outcome/epic/story hierarchy."""
-        print("📋 Creating issue templates...")
-
-        template_dir = Path(".github/ISSUE_TEMPLATE")
-        template_dir.mkdir(parents=True, exist_ok=True)
-
-        # Outcome template
-        outcome_template = """---
+_OUTCOME_TEMPLATE: Final[str] = """---
 name: 💼 Outcome
 about: Create a new business outcome that groups related epics
 title: 'Outcome: [Brief description]'
@@ -494,8 +280,7 @@ This outcome will be delivered through the following epics:
 [Additional context, assumptions, or constraints]
 """
 
-        # Epic template
-        epic_template = """---
+_EPIC_TEMPLATE: Final[str] = """---
 name: 🚀 Epic
 about: Create a new epic under a business outcome
 title: 'Epic: [Brief description]'
@@ -556,8 +341,7 @@ This epic will be implemented through the following stories:
 [Technical notes, architectural decisions, or implementation details]
 """
 
-        # Story template
-        story_template = """---
+_STORY_TEMPLATE: Final[str] = """---
 name: 📋 Story
 about: Create a new development story under an epic
 title: 'Story: [Brief description]'
@@ -607,28 +391,7 @@ assignees: []
 [Implementation notes, technical considerations, or edge cases]
 """
 
-        # Write templates to files
-        templates = [
-            ("outcome.md", outcome_template),
-            ("epic.md", epic_template),
-            ("story.md", story_template),
-        ]
-
-        for filename, content in templates:
-            template_path = template_dir / filename
-            with open(template_path, "w") as f:
-                f.write(content)
-            self.created_files.append(f".github/ISSUE_TEMPLATE/{filename}")
-
-    def _create_project_automation(self) -> None:
-        """Create GitHub Actions workflows for project automation."""
-        print("🤖 Creating project automation workflows...")
-
-        workflow_dir = Path(".github/workflows")
-        workflow_dir.mkdir(parents=True, exist_ok=True)
-
-        # Project automation workflow
-        automation_workflow = """name: Project Automation
+_AUTOMATION_WORKFLOW: Final[str] = """name: Project Automation
 
 on:
   issues:
@@ -728,8 +491,7 @@ jobs:
             }
 """
 
-        # Outcome metrics workflow
-        metrics_workflow = """name: Outcome Metrics Dashboard
+_METRICS_WORKFLOW: Final[str] = """name: Outcome Metrics Dashboard
 
 on:
   schedule:
@@ -818,24 +580,7 @@ jobs:
             }
 """
 
-        # Write workflows to files
-        workflows = [
-            ("project-automation.yml", automation_workflow),
-            ("outcome-metrics.yml", metrics_workflow),
-        ]
-
-        for filename, content in workflows:
-            workflow_path = workflow_dir / filename
-            with open(workflow_path, "w") as f:
-                f.write(content)
-            self.created_files.append(f".github/workflows/{filename}")
-
-    def _setup_dependabot(self) -> None:
-        """Setup Dependabot configuration."""
-        dependabot_dir = Path(".github")
-        dependabot_dir.mkdir(exist_ok=True)
-
-        dependabot_config = """version: 2
+_DEPENDABOT_YML: Final[str] = """version: 2
 updates:
   - package-ecosystem: "pip"
     directory: "/"
@@ -851,144 +596,768 @@ updates:
       - "@me"
 """
 
-        with open(dependabot_dir / "dependabot.yml", "w") as f:
-            f.write(dependabot_config)
-        self.created_files.append(".github/dependabot.yml")
 
-    def _setup_branch_protection(self) -> None:
-        """Setup branch protection rules for the main branch."""
-        print("🛡️ Setting up branch protection rules...")
+@functools.lru_cache(maxsize=None)
+def _fetch_gitignore_template(name: str) -> str:
+    """
+    Download a gitignore template from the public github/gitignore mirror.
+
+    Templates are cached under ``$XDG_CACHE_HOME/perses-llm-d/gitignore`` and
+    reused for a day, so repeated runs skip the download.
 
-        user = self._get_github_user()
-        repo_full_name = f"{user}/{self.options.repo_name}"
+    Args:
+        name: Template name as it appears in the repository, e.g. ``Python``
+
+    Returns:
+        The template text
+
+    Raises:
+        OSError: If the template cannot be downloaded
+        http.client.HTTPException: If the response is malformed or truncated
+        ValueError: If the template is not valid UTF-8
+    """
+    # Only plain file names are cached; anything path-like goes to the network
+    cache_name = None
+    if name and os.path.basename(name) == name and not name.startswith("."):
+        cache_name = f"gitignore/{name}.gitignore"
+        cached = read_cache(cache_name, _GITIGNORE_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+    url = _GITIGNORE_URL.format(urllib.parse.quote(name))
+    with urllib.request.urlopen(url, timeout=5) as response:
+        content = response.read().decode("utf-8")
+
+    if cache_name is not None:
+        write_cache(cache_name, content)
+    return content
+
+
+def _fast_rmtree(root: Path) -> None:
+    """
+    Remove a directory tree, unlinking its files on a thread pool.
+
+    ``os.unlink`` releases the GIL, so large trees (e.g. a generated website
+    with its node_modules) are removed in parallel rather than one inode at a
+    time. Anything the fast path cannot remove is left to ``shutil.rmtree``.
+    A missing ``root`` is not an error.
+
+    Args:
+        root: Directory to remove
+    """
+    files: List[str] = []
+    directories: List[str] = []
+    try:
+        stack = [os.fspath(root)]
+        while stack:
+            path = stack.pop()
+            directories.append(path)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+
+        if len(files) < _PARALLEL_UNLINK_THRESHOLD:
+            for path in files:
+                os.unlink(path)
+        else:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+                list(pool.map(os.unlink, files))
+
+        # Directories were collected parents first, so remove them in reverse
+        for path in reversed(directories):
+            os.rmdir(path)
+    except OSError:
+        if os.path.lexists(root):
+            shutil.rmtree(root)
+
+
+async def _gather_all(*aws: Any) -> None:
+    """
+    Await every awaitable, then raise the first failure, if any.
+
+    Unlike a plain ``asyncio.gather``, no step is left running in the
+    background when another one fails, so rollback never races it.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class GitHubInitOptions:
+    """Options for GitHub repository initialization; immutable once built."""
+
+    repo_name: str
+    description: Optional[str] = None
+    private: bool = True  # Default to private
+    license: Optional[str] = None
+    gitignore: Optional[str] = None
+    readme: bool = True
+    default_branch: str = "main"
+    topics: Optional[List[str]] = None
+    create_website: bool = False
+    enable_dependabot: bool = True
+    dry_run: bool = False
+
+    # GitHub Projects
+    create_project: bool = True
+    project_template: str = "development"
+
+    # Advanced GitHub Automation
+    enable_auto_version: bool = True
+    enable_auto_merge: bool = True
+    enable_claude_review: bool = False
+    enable_auto_release: bool = True
+    enable_branch_protection: bool = True
+
+
+class GitHubInitialization:
+    """Core GitHub repository initialization logic."""
+
+    def __init__(self, options: GitHubInitOptions):
+        self.options = options
+        # All repository paths are resolved against this root; the process
+        # working directory is never changed
+        self._repo_root = Path.cwd() / options.repo_name
+        # Append-only record of generated paths, in creation order. A plain list
+        # is enough: a run creates about a dozen files, and rollback removes the
+        # whole directory rather than looking individual paths up.
+        self.created_files: List[str] = []
+        self._pending_writes: List[Tuple[str, str]] = []
+        # Background gh processes whose output is not needed; see _wait_for_processes
+        self._pending_procs: List[subprocess.Popen] = []
+        self._github_user: Optional[str] = None
+        self._token: Optional[str] = None
+        self._token_resolved = False
+        self._gh_environ: Optional[dict] = None
+        self._api: Optional[GitHubAPI] = None
+        self._api_resolved = False
+        # Set once the local and GitHub repositories exist, so rollback only
+        # removes what this run created
+        self._local_created = False
+        self._remote_created = False
+
+    def execute(self) -> None:
+        """Execute the repository initialization process."""
+        if self.options.dry_run:
+            self._execute_dry_run()
+            return
 
         try:
-            # Create branch protection rule using GitHub CLI
-            cmd = [
-                "gh",
-                "api",
-                "--method",
-                "PUT",
-                f"/repos/{repo_full_name}/branches/{self.options.default_branch}/protection",
-                "--field",
-                'required_status_checks={"strict":true,"checks":[]}',
-                "--field",
-                "enforce_admins=false",
-                "--field",
-                'required_pull_request_reviews={"required_approving_review_count":1,"dismiss_stale_reviews":true,"require_code_owner_reviews":false}',
-                "--field",
-                "restrictions=null",
-                "--field",
-                "allow_force_pushes=false",
-                "--field",
-                "allow_deletions=false",
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0:
-                print("✅ Branch protection rules configured successfully")
-            else:
-                print(f"⚠️ Warning: Could not set up branch protection: {result.stderr}")
+            # Validate prerequisites before starting; a failure here has
+            # nothing to roll back, but a warmed connection is still closed
+            self._validate_prerequisites()
+        except Exception:
+            if self._api is not None:
+                self._api.close()
+            raise
+
+        try:
+            print(f"🚀 Initializing GitHub repository: {self.options.repo_name}")
+
+            # Steps 1-9: Local repository and files, the GitHub repository,
+            # then project board, dependabot, automation and branch protection,
+            # with independent steps running concurrently
+            asyncio.run(self._run_setup())
+
+            # Step 10: Write all generated files, then commit and push
+            self._flush_writes()
+            self._initial_commit_and_push()
+            self._wait_for_processes()
+
+            repo_name = self.options.repo_name
+            print(
+                f"✅ Repository '{repo_name}' initialized successfully!\n"
+                f"📂 Local directory: {self._repo_root}\n"
+                f"🔗 GitHub URL: https://github.com/{self._get_github_user()}/{repo_name}"
+            )
 
         except Exception as e:
-            print(f"⚠️ Warning: Failed to setup branch protection: {e}")
+            print(f"❌ Error during initialization: {e}")
+            self._rollback()
+            raise
+        finally:
+            if self._api is not None:
+                self._api.close()
 
-    def _configure_automation(self) -> None:
-        """Configure advanced GitHub automation."""
-        if self.options.enable_auto_version:
-            print("🔄 Configuring automatic versioning...")
+    def _validate_prerequisites(self) -> None:
+        """Validate that all prerequisites are available."""
+        # Look the binaries up on PATH first so a missing one fails fast
+        if shutil.which("gh") is None:
+            raise RuntimeError("GitHub CLI (gh) is not installed")
+        if shutil.which("git") is None:
+            raise RuntimeError("Git is not installed")
+
+        # Check if repo name already exists locally
+        if os.path.lexists(self._repo_root):
+            raise RuntimeError(f"Directory '{self.options.repo_name}' already exists")
+
+        # Open the API connection in the background while gh checks its
+        # authentication, so its handshake is done by the first request
+        api = self._get_api()
+        if api is not None:
+            threading.Thread(target=api.warm, daemon=True).start()
+
+        # Check that gh is authenticated; only the exit status matters
+        if subprocess.call(
+            ["gh", "auth", "status"],
+            env=self._gh_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ):
+            raise RuntimeError("GitHub CLI (gh) is not authenticated")
+
+    def _get_api(self) -> Optional[GitHubAPI]:
+        """Return the pooled API client, or None when no token is available."""
+        if not self._api_resolved:
+            token = self._get_token()
+            self._api = GitHubAPI(token) if token else None
+            self._api_resolved = True
+        return self._api
+
+    def _get_token(self) -> Optional[str]:
+        """Resolve the GitHub token once per run."""
+        if not self._token_resolved:
+            self._token = get_token()
+            self._token_resolved = True
+        return self._token
+
+    def _gh_env(self) -> dict:
+        """
+        Environment for ``gh`` subprocesses.
+
+        Passing the already-resolved token as ``GH_TOKEN`` spares each ``gh``
+        invocation its own keyring lookup.
+        """
+        if self._gh_environ is None:
+            env = os.environ.copy()
+            token = self._get_token()
+            if token:
+                env["GH_TOKEN"] = token
+            self._gh_environ = env
+        return self._gh_environ
+
+    def _get_github_user(self) -> str:
+        """
+        Get the current GitHub username.
+
+        The login is looked up at most once per run, and is also kept on disk
+        for an hour so back-to-back runs skip the ``/user`` request.
+        """
+        if self._github_user is None:
+            self._github_user = read_cache("gh-user", _USER_CACHE_TTL) or None
+        if self._github_user is None:
+            try:
+                user_data = self._api_request("GET", "/user")
+            except GitHubAPIError:
+                # Don't cache failures; a later call may succeed
+                return "unknown"
+            login = user_data.get("login")
+            if not login:
+                return "unknown"
+            self._set_github_user(login)
+        return self._github_user
+
+    def _set_github_user(self, login: str) -> None:
+        """Remember the authenticated user's login for this and later runs."""
+        self._github_user = login
+        write_cache("gh-user", login)
+
+    def _api_request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """
+        Call the GitHub API, over a pooled connection when a token is available.
+
+        Falls back to ``gh api`` when no token can be found.
+
+        Raises:
+            GitHubAPIError: If the request fails
+        """
+        api = self._get_api()
+        if api is not None:
+            return api.request(method, path, body, headers)
+
+        cmd = ["gh", "api", "--method", method, path]
+        for name, value in (headers or {}).items():
+            cmd.extend(["-H", f"{name}: {value}"])
+        if body is not None:
+            cmd.extend(["--input", "-"])
+        result = subprocess.run(
+            cmd,
+            input=dumps(body) if body is not None else None,
+            env=self._gh_env(),
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            output = result.stderr.strip() or result.stdout.strip()
+            raise GitHubAPIError(None, output.decode("utf-8", "replace"))
+        return loads(result.stdout) if result.stdout.strip() else None
+
+    def _graphql(self, query: str, headers: Optional[dict] = None) -> dict:
+        """Run a GraphQL document and return its data."""
+        response = self._api_request("POST", "/graphql", {"query": query}, headers)
+        if response.get("errors"):
+            messages = "; ".join(e.get("message", "") for e in response["errors"])
+            raise GitHubAPIError(None, f"GraphQL request failed: {messages}")
+        return response["data"]
+
+    def _queue_write(self, path: str, content: str) -> None:
+        """Queue a generated file to be written by ``_flush_writes``."""
+        self._pending_writes.append((path, content))
+        self.created_files.append(path)
+
+    def _flush_writes(self) -> None:
+        """Write all queued files, creating each directory exactly once."""
+        # Collect every ancestor up front (e.g. .github for both .github/workflows
+        # and .github/ISSUE_TEMPLATE) and create them shallowest first, so each
+        # directory costs a single mkdir instead of a parents=True walk
+        root = self._repo_root
+        # Build each target Path once and reuse it for both mkdir and write
+        targets = [(root / path, content) for path, content in self._pending_writes]
+        directories = set()
+        for target, _ in targets:
+            parent = target.parent
+            # Stop at the first known directory; its ancestors are already in
+            while parent != root and parent not in directories:
+                directories.add(parent)
+                parent = parent.parent
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            directory.mkdir(exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            # list() surfaces the first write error, if any
+            list(
+                pool.map(
+                    lambda item: item[0].write_text(item[1], encoding="utf-8"),
+                    targets,
+                )
+            )
+        self._pending_writes.clear()
+
+    def _init_git_repo(self) -> None:
+        """Initialize a new git repository."""
+        # Create directory and initialize git
+        self._repo_root.mkdir()
+        self._local_created = True
+
+        subprocess.run(
+            ["git", "init", "-b", self.options.default_branch],
+            cwd=self._repo_root,
+            check=True,
+        )
+
+    def _create_initial_files(self) -> None:
+        """Create initial files for the repository."""
+        if self.options.readme:
+            self._create_readme()
+
+        if self.options.gitignore:
+            self._create_gitignore()
+
+        # LICENSE names the repository owner, so it is created by
+        # _configure_repository once the GitHub repository exists
+
+    def _create_readme(self) -> None:
+        """Create a README.md file."""
+        content = _README_TEMPLATE.format(
+            repo_name=self.options.repo_name,
+            description=self.options.description or "",
+            license=self.options.license or "See LICENSE file for details.",
+        )
+        self._queue_write("README.md", content)
+
+    def _create_gitignore(self) -> None:
+        """Create .gitignore file."""
+        name = self.options.gitignore
+        # Fetch the template straight from the public mirror; no auth needed
+        try:
+            self._queue_write(".gitignore", _fetch_gitignore_template(name))
+            return
+        except (OSError, http.client.HTTPException, ValueError):
+            pass
+
+        # The mirror is case-sensitive, the API accepts any casing
+        source = None
+        try:
+            path = f"/gitignore/templates/{urllib.parse.quote(name)}"
+            data = self._api_request("GET", path)
+            source = data.get("source") if data else None
+        except (GitHubAPIError, ValueError, OSError, http.client.HTTPException) as e:
+            print(f"⚠️ Warning: Could not fetch gitignore template '{name}': {e}")
+
+        # Fallback to basic gitignore, written exactly once
+        self._queue_write(".gitignore", source or _BASIC_GITIGNORE)
+
+    def _create_license(self) -> None:
+        """Create LICENSE file."""
+        # For simplicity, create a basic MIT license placeholder
+        # In a real implementation, you'd want to fetch the actual license text
+        content = _MIT_LICENSE_TEMPLATE.format(owner=self._get_github_user())
+        self._queue_write("LICENSE", content)
+
+    def _create_github_workflows(self) -> None:
+        """Create GitHub Actions workflows."""
+        # Create a basic CI workflow
+        self._queue_write(".github/workflows/ci.yml", _CI_WORKFLOW)
+
+    def _initialize_docusaurus(self) -> None:
+        """Initialize Docusaurus documentation site."""
+        print("📚 Setting up Docusaurus documentation site...")
+        # This is a placeholder - real implementation would need Node.js setup
+        self._queue_write(
+            "docs/index.md",
+            _DOCS_INDEX_TEMPLATE.format(
+                repo_name=self.options.repo_name,
+                description=self.options.description
+                or "Add your project description here.",
+            ),
+        )
+
+    def _create_github_repo(self) -> None:
+        """Create the GitHub repository."""
+        # The repository is created empty on purpose: README, .gitignore and
+        # LICENSE are generated locally and pushed with the rest of the initial
+        # commit. Server-side auto_init/gitignore_template/license_template
+        # would create a commit unrelated to the local history and reject the
+        # first push (gh refuses those flags together with --source for the
+        # same reason).
+        body = {"name": self.options.repo_name, "private": self.options.private}
+
+        if self.options.description:
+            body["description"] = self.options.description
+
+        repo = self._api_request("POST", "/user/repos", body)
+        self._remote_created = True
+        # The new repository names its owner, which saves a separate /user lookup
+        # for the labels, branch protection and remote URL that follow; it also
+        # supersedes a login read from the on-disk cache
+        if repo:
+            self._set_github_user(repo["owner"]["login"])
+
+    async def _run_setup(self) -> None:
+        """Create the local and GitHub repositories, then configure them."""
+        # Resolve the API client on this thread before fanning out
+        self._get_api()
+
+        # The local repository and its generated files (including the gitignore
+        # download) don't depend on the GitHub repository, so they are built
+        # while it is being created
+        await _gather_all(
+            asyncio.to_thread(self._create_local_repo),
+            asyncio.to_thread(self._create_github_repo),
+        )
+        await self._configure_repository()
+
+    def _create_local_repo(self) -> None:
+        """Initialize the local repository and queue its initial content."""
+        # Step 1: Initialize git repository
+        self._init_git_repo()
+
+        # Step 2: Create initial files
+        self._create_initial_files()
+
+        # Step 3: Create GitHub Actions workflows
+        self._create_github_workflows()
 
-        if self.options.enable_auto_merge:
-            print("🔄 Configuring auto-merge for dependabot...")
+        # Step 4: Initialize Docusaurus if requested
+        if self.options.create_website:
+            self._initialize_docusaurus()
 
-        if self.options.enable_auto_release:
-            print("🔄 Configuring automatic releases...")
+    async def _configure_repository(self) -> None:
+        """Run the independent post-creation setup steps concurrently."""
+        # Normally already known from repo creation; resolve it once here in
+        # case it is not, before fanning out to threads
+        self._get_github_user()
+
+        if self.options.license:
+            self._create_license()
+
+        tasks = []
+        if self.options.create_project:
+            # Starts gh in the background and returns immediately
+            self._create_github_project()
+        if self.options.create_project or self.options.enable_branch_protection:
+            tasks.append(
+                asyncio.ensure_future(
+                    asyncio.to_thread(self._apply_repository_settings)
+                )
+            )
+
+        # Local file generation overlaps with the network calls
+        if self.options.create_project:
+            # Issue templates for structured development
+            self._create_issue_templates()
+            # Automation workflows for project management
+            self._create_project_automation()
+        if self.options.enable_dependabot:
+            self._setup_dependabot()
+        self._configure_automation()
+
+        await _gather_all(*tasks)
+
+    def _create_github_project(self) -> None:
+        """Create GitHub project board for the outcome management system."""
+        print("📋 Creating GitHub project with outcome management...")
+        # Repository-level project creation; nothing reads its output, so it
+        # runs in the background and is reaped by _wait_for_processes
+        self._pending_procs.append(
+            subprocess.Popen(
+                [
+                    "gh",
+                    "project",
+                    "create",
+                    "--title",
+                    f"{self.options.repo_name} Development",
+                    "--body",
+                    f"Development tracking for {self.options.repo_name}",
+                ],
+                cwd=self._repo_root,
+                env=self._gh_env(),
+                stdout=subprocess.DEVNULL,
+            )
+        )
+
+    def _wait_for_processes(self) -> None:
+        """Wait for background processes, raising if any of them failed."""
+        while self._pending_procs:
+            proc = self._pending_procs.pop(0)
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+    def _apply_repository_settings(self) -> None:
+        """
+        Create the outcome labels and branch protection in one GraphQL batch.
+
+        A single query resolves the repository ID and any labels that already
+        exist; a single mutation then creates or updates every label and adds
+        the branch protection rule, instead of one request per setting.
+        """
+        labels = _OUTCOME_LABELS if self.options.create_project else ()
+        protect = self.options.enable_branch_protection
+        if labels:
+            print("🏷️  Creating outcome management labels...")
+        if protect:
+            print("🛡️ Setting up branch protection rules...")
+
+        lookups = " ".join(
+            f"l{i}: label(name: {json.dumps(name)}) {{ id }}"
+            for i, (name, _, _) in enumerate(labels)
+        )
+        query = (
+            f"query {{ repository(owner: {json.dumps(self._get_github_user())}, "
+            f"name: {json.dumps(self.options.repo_name)}) {{ id {lookups} }} }}"
+        )
+        try:
+            repository = self._graphql(query, _LABEL_PREVIEW_HEADERS)["repository"]
+        except GitHubAPIError as e:
+            print(f"⚠️ Warning: Could not look up the repository: {e}")
+            return
+
+        mutations = self._label_mutations(repository, labels)
+        if protect:
+            mutations.append(self._branch_protection_mutation(repository["id"]))
+        try:
+            self._graphql(
+                f"mutation {{ {' '.join(mutations)} }}", _LABEL_PREVIEW_HEADERS
+            )
+        except GitHubAPIError as e:
+            # Don't fail initialization if labels or protection can't be set up
+            print(f"⚠️ Warning: Could not apply labels or branch protection: {e}")
+            return
+        if protect:
+            print("✅ Branch protection rules configured successfully")
+
+    @staticmethod
+    def _label_mutations(
+        repository: dict, labels: Tuple[Tuple[str, str, str], ...]
+    ) -> List[str]:
+        """Build aliased mutations creating missing labels and updating others."""
+        mutations = []
+        for i, (name, color, description) in enumerate(labels):
+            existing = repository.get(f"l{i}")
+            fields = (
+                f"color: {json.dumps(color)}, "
+                f"description: {json.dumps(description)}"
+            )
+            if existing:
+                mutations.append(
+                    f"l{i}: updateLabel(input: {{id: {json.dumps(existing['id'])}, "
+                    f"{fields}}}) {{ label {{ id }} }}"
+                )
+            else:
+                mutations.append(
+                    f"l{i}: createLabel(input: {{repositoryId: "
+                    f"{json.dumps(repository['id'])}, name: {json.dumps(name)}, "
+                    f"{fields}}}) {{ label {{ id }} }}"
+                )
+        return mutations
+
+    def _branch_protection_mutation(self, repository_id: str) -> str:
+        """
+        Build the mutation protecting the default branch.
+
+        Protection rules match by pattern, so the rule can be created before
+        the branch itself has been pushed.
+        """
+        return (
+            "protection: createBranchProtectionRule(input: {"
+            f"repositoryId: {json.dumps(repository_id)}, "
+            f"pattern: {json.dumps(self.options.default_branch)}, "
+            "requiresStatusChecks: true, requiresStrictStatusChecks: true, "
+            "isAdminEnforced: false, "
+            "requiresApprovingReviews: true, requiredApprovingReviewCount: 1, "
+            "dismissesStaleReviews: true, requiresCodeOwnerReviews: false, "
+            "allowsForcePushes: false, allowsDeletions: false"
+            "}) { branchProtectionRule { id } }"
+        )
+
+    def _create_issue_templates(self) -> None:
+        """Create issue templates for outcome/epic/story hierarchy."""
+        print("📋 Creating issue templates...")
+
+        # Write templates to files
+        templates = [
+            ("outcome.md", _OUTCOME_TEMPLATE),
+            ("epic.md", _EPIC_TEMPLATE),
+            ("story.md", _STORY_TEMPLATE),
+        ]
+
+        for filename, content in templates:
+            self._queue_write(f".github/ISSUE_TEMPLATE/{filename}", content)
+
+    def _create_project_automation(self) -> None:
+        """Create GitHub Actions workflows for project automation."""
+        print("🤖 Creating project automation workflows...")
+
+        # Write project automation and outcome metrics workflows to files
+        workflows = [
+            ("project-automation.yml", _AUTOMATION_WORKFLOW),
+            ("outcome-metrics.yml", _METRICS_WORKFLOW),
+        ]
+
+        for filename, content in workflows:
+            self._queue_write(f".github/workflows/{filename}", content)
+
+    def _setup_dependabot(self) -> None:
+        """Setup Dependabot configuration."""
+        self._queue_write(".github/dependabot.yml", _DEPENDABOT_YML)
+
+    def _configure_automation(self) -> None:
+        """Configure advanced GitHub automation."""
+        messages = [
+            message
+            for option, message in _AUTOMATION_MESSAGES
+            if getattr(self.options, option)
+        ]
+        if messages:
+            print("\n".join(messages))
 
     def _initial_commit_and_push(self) -> None:
         """Make initial commit and push to GitHub."""
-        subprocess.run(["git", "add", "."], check=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
-
-        # Add remote and push
         user = self._get_github_user()
+        # Stage, commit, add the remote and push from a single shell
         subprocess.run(
             [
-                "git",
-                "remote",
-                "add",
-                "origin",
+                "sh",
+                "-c",
+                _COMMIT_AND_PUSH_SCRIPT,
+                "sh",
+                "Initial commit",
                 f"git@github.com:{user}/{self.options.repo_name}.git",
+                self.options.default_branch,
             ],
+            cwd=self._repo_root,
             check=True,
         )
-        subprocess.run(
-            ["git", "push", "-u", "origin", self.options.default_branch], check=True
-        )
 
     def _execute_dry_run(self) -> None:
         """Show what would be created without actually creating it."""
-        print("🔍 DRY RUN MODE - Preview of what would be created:")
-        print(f"📦 Repository name: {self.options.repo_name}")
-        print(f"🔒 Visibility: {'private' if self.options.private else 'public'}")
-        if self.options.description:
-            print(f"📝 Description: {self.options.description}")
-        print(f"📄 README: {'✓' if self.options.readme else '✗'}")
-        if self.options.gitignore:
-            print(f"🚫 .gitignore: {self.options.gitignore}")
-        if self.options.license:
-            print(f"📜 License: {self.options.license}")
-        print(f"🌐 Website: {'✓' if self.options.create_website else '✗'}")
-        print(f"📋 Project board: {'✓' if self.options.create_project else '✗'}")
-        print(f"🤖 Dependabot: {'✓' if self.options.enable_dependabot else '✗'}")
-        print(
-            f"🛡️ Branch protection: {'✓' if self.options.enable_branch_protection else '✗'}"
-        )
-
-        # New outcome management features
-        print("\n🎯 Outcome Management System:")
-        print("   🏷️  Hierarchical labels: outcome, epic, story")
-        print("   📋 Issue templates: outcome.md, epic.md, story.md")
-        print("   🤖 Project automation workflow")
-        print("   📊 Weekly metrics dashboard")
-
-        print("\n🎯 GitHub Actions workflows:")
-        print("   🚀 CI/CD pipeline")
-        print("   📋 Project automation")
-        print("   📊 Outcome metrics dashboard")
+        options = self.options
+        lines = [
+            "🔍 DRY RUN MODE - Preview of what would be created:",
+            f"📦 Repository name: {options.repo_name}",
+            f"🔒 Visibility: {'private' if options.private else 'public'}",
+        ]
+        if options.description:
+            lines.append(f"📝 Description: {options.description}")
+        lines.append(f"📄 README: {'✓' if options.readme else '✗'}")
+        if options.gitignore:
+            lines.append(f"🚫 .gitignore: {options.gitignore}")
+        if options.license:
+            lines.append(f"📜 License: {options.license}")
+        lines += [
+            f"🌐 Website: {'✓' if options.create_website else '✗'}",
+            f"📋 Project board: {'✓' if options.create_project else '✗'}",
+            f"🤖 Dependabot: {'✓' if options.enable_dependabot else '✗'}",
+            f"🛡️ Branch protection: "
+            f"{'✓' if options.enable_branch_protection else '✗'}",
+            _DRY_RUN_FEATURES,
+        ]
+        # One write for the whole preview
+        print("\n".join(lines))
 
     def _rollback(self) -> None:
         """Rollback changes on failure."""
         try:
             print("🔄 Rolling back changes...")
 
-            # Change back to original directory
-            os.chdir(self.original_dir)
+            # Stop background processes still working on the repository
+            for proc in self._pending_procs:
+                proc.kill()
+                proc.wait()
+            self._pending_procs.clear()
+
+            # Remote and local cleanup touch disjoint state, so run them together
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [
+                    pool.submit(self._delete_remote_repo),
+                    pool.submit(self._remove_local_repo),
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"⚠️ Error during rollback: {e}")
 
-            # Try to delete the GitHub repository if it was created
+        except Exception as e:
+            print(f"⚠️ Error during rollback: {e}")
+
+    def _delete_remote_repo(self) -> None:
+        """Try to delete the GitHub repository if it was created."""
+        if not self._remote_created:
+            # Nothing to delete; skip the lookup and the request
+            return
+        path = f"/repos/{self._get_github_user()}/{self.options.repo_name}"
+        for attempt in range(_DELETE_ATTEMPTS):
             try:
-                user = self._get_github_user()
-                subprocess.run(
-                    [
-                        "gh",
-                        "repo",
-                        "delete",
-                        f"{user}/{self.options.repo_name}",
-                        "--yes",
-                    ],
-                    capture_output=True,
+                # Reuses the pooled API connection instead of spawning gh
+                self._api_request("DELETE", path)
+                return
+            except GitHubAPIError as e:
+                # Retry dropped connections, rate limits and gateway errors;
+                # gh and GraphQL failures carry no status and are permanent
+                transient = (
+                    isinstance(e, GitHubConnectionError)
+                    or e.status in _TRANSIENT_STATUSES
                 )
-            except Exception:
-                pass
+                if not transient or attempt == _DELETE_ATTEMPTS - 1:
+                    print(f"⚠️ Warning: Could not delete GitHub repository: {e}")
+                    return
+            time.sleep(0.5 * 2**attempt)
 
-            # Remove local directory
-            import shutil
-
-            if Path(self.options.repo_name).exists():
-                shutil.rmtree(self.options.repo_name)
-
-        except Exception as e:
-            print(f"⚠️ Error during rollback: {e}")
+    def _remove_local_repo(self) -> None:
+        """Remove the local repository directory, if it was created."""
+        if self._local_created:
+            _fast_rmtree(self._repo_root)
 
 
 class GitHubInitCommand(BaseCommand):
@@ -1016,36 +1385,127 @@ class GitHubInitCommand(BaseCommand):
     - Label validation and management
     """
 
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "github-init"
-
-    @property
-    def help_text(self) -> str:
-        """Return the help text for the command."""
-        return (
-            "Initialize a new GitHub repository with outcome-driven project management.\n\n"
-            "This command creates a complete repository setup including Git initialization,\n"
-            "essential files (README, .gitignore, LICENSE), GitHub Actions workflows,\n"
-            "project boards with outcome management, and automated dependency management.\n\n"
-            "Examples:\n"
-            '  /github-init my-project --description "My awesome project"\n'
-            "  /github-init my-lib --public --license MIT --gitignore Python\n"
-            "  /github-init docs-site --create-website --dry-run\n\n"
-            "Features:\n"
-            "• 🔒 Private repositories by default (security-first)\n"
-            "• 🎯 Outcome management system (outcome/epic/story hierarchy)\n"
-            "• 📋 Professional issue templates for structured development\n"
-            "• 🤖 Automated progress tracking and metrics dashboard\n"
-            "• 🏷️ Hierarchical labels for project organization\n"
-            "• 🚀 Complete CI/CD workflow setup\n"
-            "• 🛡️ Branch protection rules enabled by default\n"
-            "• 📚 Optional Docusaurus documentation site\n"
-            "• 📋 Repository-level project boards\n"
-            "• 🔄 Rollback on failure\n"
-            "• 👀 Dry-run preview mode"
-        )
+    __slots__ = ()
+
+    name = "github-init"
+    help_text = (
+        "Initialize a new GitHub repository with outcome-driven project management.\n\n"
+        "This command creates a complete repository setup including Git initialization,\n"
+        "essential files (README, .gitignore, LICENSE), GitHub Actions workflows,\n"
+        "project boards with outcome management, and automated dependency management.\n\n"
+        "Examples:\n"
+        '  /github-init my-project --description "My awesome project"\n'
+        "  /github-init my-lib --public --license MIT --gitignore Python\n"
+        "  /github-init docs-site --create-website --dry-run\n\n"
+        "Features:\n"
+        "• 🔒 Private repositories by default (security-first)\n"
+        "• 🎯 Outcome management system (outcome/epic/story hierarchy)\n"
+        "• 📋 Professional issue templates for structured development\n"
+        "• 🤖 Automated progress tracking and metrics dashboard\n"
+        "• 🏷️ Hierarchical labels for project organization\n"
+        "• 🚀 Complete CI/CD workflow setup\n"
+        "• 🛡️ Branch protection rules enabled by default\n"
+        "• 📚 Optional Docusaurus documentation site\n"
+        "• 📋 Repository-level project boards\n"
+        "• 🔄 Rollback on failure\n"
+        "• 👀 Dry-run preview mode"
+    )
+
+    # Command-line parameters, in --help order; each option is copied into
+    # GitHubInitOptions (except ``public``, which becomes ``private``)
+    params = [
+        Param(
+            "repo_name",
+            ...,
+            "Name of the repository to create",
+            str,
+            argument=True,
+        ),
+        Param(
+            "description",
+            None,
+            "Repository description",
+            Optional[str],
+            ("--description", "-d"),
+        ),
+        Param(
+            "public",
+            False,
+            "Create public repository (default: private)",
+            bool,
+            ("--public",),
+        ),
+        Param(
+            "license",
+            None,
+            "License type (e.g., MIT, Apache-2.0)",
+            Optional[str],
+            ("--license", "-l"),
+        ),
+        Param(
+            "gitignore",
+            None,
+            "Gitignore template (e.g., Python, Node)",
+            Optional[str],
+            ("--gitignore", "-g"),
+        ),
+        Param(
+            "create_website",
+            False,
+            "Initialize Docusaurus documentation site",
+            bool,
+            ("--create-website",),
+        ),
+        Param(
+            "enable_dependabot",
+            True,
+            "Enable Dependabot automation",
+            bool,
+            ("--enable-dependabot/--no-dependabot",),
+        ),
+        Param(
+            "dry_run",
+            False,
+            "Preview what would be created without executing",
+            bool,
+            ("--dry-run",),
+        ),
+        Param(
+            "create_project",
+            True,
+            "Create GitHub project board",
+            bool,
+            ("--create-project/--no-project",),
+        ),
+        Param(
+            "enable_auto_version",
+            True,
+            "Enable automatic versioning",
+            bool,
+            ("--enable-auto-version/--no-auto-version",),
+        ),
+        Param(
+            "enable_auto_merge",
+            True,
+            "Enable auto-merge for dependabot",
+            bool,
+            ("--enable-auto-merge/--no-auto-merge",),
+        ),
+        Param(
+            "enable_auto_release",
+            True,
+            "Enable automatic releases",
+            bool,
+            ("--enable-auto-release/--no-auto-release",),
+        ),
+        Param(
+            "enable_branch_protection",
+            True,
+            "Enable branch protection rules",
+            bool,
+            ("--enable-branch-protection/--no-branch-protection",),
+        ),
+    ]
 
     def execute(self, **kwargs: Any) -> None:
         """
@@ -1062,22 +1522,13 @@ class GitHubInitCommand(BaseCommand):
                 return
 
             # Build options from arguments
-            options = GitHubInitOptions(
-                repo_name=repo_name,
-                description=kwargs.get("description"),
-                private=not kwargs.get("public", False),
-                license=kwargs.get("license"),
-                gitignore=kwargs.get("gitignore"),
-                readme=kwargs.get("readme", True),
-                create_website=kwargs.get("create_website", False),
-                enable_dependabot=kwargs.get("enable_dependabot", True),
-                dry_run=kwargs.get("dry_run", False),
-                create_project=kwargs.get("create_project", True),
-                enable_auto_version=kwargs.get("enable_auto_version", True),
-                enable_auto_merge=kwargs.get("enable_auto_merge", True),
-                enable_auto_release=kwargs.get("enable_auto_release", True),
-                enable_branch_protection=kwargs.get("enable_branch_protection", True),
-            )
+            opts = {
+                param.name: kwargs.get(param.name, param.default)
+                for param in self.params
+            }
+            opts["repo_name"] = repo_name
+            opts["private"] = not opts.pop("public")
+            options = GitHubInitOptions(**opts)
 
             # Execute the initialization
             initializer = GitHubInitialization(options)
@@ -1087,91 +1538,3 @@ class GitHubInitCommand(BaseCommand):
 
         except Exception as e:
             self.error(f"Failed to initialize repository: {str(e)}")
-
-    def create_typer_command(self):
-        """Create a Typer command with custom arguments."""
-
-        def command_wrapper(
-            repo_name: str = typer.Argument(
-                ..., help="Name of the repository to create"
-            ),
-            description: Optional[str] = typer.Option(
-                None, "--description", "-d", help="Repository description"
-            ),
-            public: bool = typer.Option(
-                False, "--public", help="Create public repository (default: private)"
-            ),
-            license: Optional[str] = typer.Option(
-                None, "--license", "-l", help="License type (e.g., MIT, Apache-2.0)"
-            ),
-            gitignore: Optional[str] = typer.Option(
-                None,
-                "--gitignore",
-                "-g",
-                help="Gitignore template (e.g., Python, Node)",
-            ),
-            create_website: bool = typer.Option(
-                False,
-                "--create-website",
-                help="Initialize Docusaurus documentation site",
-            ),
-            enable_dependabot: bool = typer.Option(
-                True,
-                "--enable-dependabot/--no-dependabot",
-                help="Enable Dependabot automation",
-            ),
-            dry_run: bool = typer.Option(
-                False,
-                "--dry-run",
-                help="Preview what would be created without executing",
-            ),
-            create_project: bool = typer.Option(
-                True,
-                "--create-project/--no-project",
-                help="Create GitHub project board",
-            ),
-            enable_auto_version: bool = typer.Option(
-                True,
-                "--enable-auto-version/--no-auto-version",
-                help="Enable automatic versioning",
-            ),
-            enable_auto_merge: bool = typer.Option(
-                True,
-                "--enable-auto-merge/--no-auto-merge",
-                help="Enable auto-merge for dependabot",
-            ),
-            enable_auto_release: bool = typer.Option(
-                True,
-                "--enable-auto-release/--no-auto-release",
-                help="Enable automatic releases",
-            ),
-            enable_branch_protection: bool = typer.Option(
-                True,
-                "--enable-branch-protection/--no-branch-protection",
-                help="Enable branch protection rules",
-            ),
-        ) -> None:
-            """Initialize a new GitHub repository with best practices."""
-            try:
-                self.execute(
-                    repo_name=repo_name,
-                    description=description,
-                    public=public,
-                    license=license,
-                    gitignore=gitignore,
-                    create_website=create_website,
-                    enable_dependabot=enable_dependabot,
-                    dry_run=dry_run,
-                    create_project=create_project,
-                    enable_auto_version=enable_auto_version,
-                    enable_auto_merge=enable_auto_merge,
-                    enable_auto_release=enable_auto_release,
-                    enable_branch_protection=enable_branch_protection,
-                )
-            except Exception as e:
-                self.console.print(
-                    f"[bold red]Error executing {self.name}:[/bold red] {str(e)}"
-                )
-                raise typer.Exit(1)
-
-        return command_wrapper
@@ -6,13 +6,16 @@ Interactive text-based configuration interface for CLAUDE.md files,
 inspired by Linux kernel menuconfig. Integrated with the new Typer-based CLI framework.
 """
 
+import os
 import re
 import shutil
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Final, Iterator, List, Optional, Tuple
 
-import typer
+from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -30,10 +33,41 @@ from textual.widgets import (
     Tree,
 )
 
+from ._compat import DATACLASS_SLOTS
+from ._git import find_git_root
 from .base import BaseCommand
 
+# The lines that matter to the parser, found in one scan of the whole file: a
+# code fence, or a header (one to six "#", whitespace, then a title). Either may
+# be indented. "[^\S\n]" is whitespace that stays on the same line.
+#
+# The pattern starts at the newline before the line rather than at "^": a
+# literal first character lets the regex engine jump from newline to newline
+# instead of attempting a match at every position. The scanned text is given a
+# leading newline so the first line is found too.
+_EVENT_RE: Final[re.Pattern] = re.compile(
+    r"\n[^\S\n]*(?:(?P<fence>```)|(?P<hashes>#{1,6})[^\S\n]+(?P<title>\S.*?)[^\S\n]*$)",
+    re.MULTILINE,
+)
+
+# Splits text into lines, keeping the newlines, exactly as readlines() does
+_LINE_RE: Final[re.Pattern] = re.compile(r"[^\n]*\n|[^\n]+")
+
+# Tree label pieces: the state box, and the marker for sections with subsections
+_ENABLED_PREFIX: Final[str] = "[*] "
+_DISABLED_PREFIX: Final[str] = "[ ] "
+_SUBSECTIONS_SUFFIX: Final[str] = " --->"
+
+# Buffer size for writing the saved CLAUDE.md
+_WRITE_BUFFER = 1 << 20
+
+# Seconds to wait before redrawing the status bar after a toggle, so a burst of
+# toggles causes one redraw
+_STATUS_DEBOUNCE = 0.05
 
-@dataclass
+
+# eq=False: each Section is a distinct object, compared and hashed by identity
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class Section:
     """Represents a section in CLAUDE.md"""
 
@@ -45,30 +79,23 @@ class Section:
     children: List["Section"] = field(default_factory=list)
     parent: Optional["Section"] = None
     content_lines: List[str] = field(default_factory=list)
+    label_suffix: str = ""  # Set by the parser once the section has children
+    tree_node: Optional[Any] = field(default=None, repr=False)  # Set by the tree
+    full_title: str = field(init=False, repr=False)
 
-    def __hash__(self):
-        """Make Section hashable by using immutable attributes"""
-        return hash((self.level, self.title, self.line_start))
-
-    def __eq__(self, other):
-        """Define equality for sections"""
-        if not isinstance(other, Section):
-            return False
-        return (
-            self.level == other.level
-            and self.title == other.title
-            and self.line_start == other.line_start
-        )
-
-    @property
-    def full_title(self) -> str:
-        prefix = "#" * self.level
-        return f"{prefix} {self.title}"
+    def __post_init__(self):
+        """Build the header line once; level and title never change"""
+        self.full_title = f"{'#' * self.level} {self.title}"
 
     @property
     def indent_level(self) -> int:
         return max(0, self.level - 1)
 
+    @property
+    def label(self) -> str:
+        prefix = _ENABLED_PREFIX if self.enabled else _DISABLED_PREFIX
+        return prefix + self.title + self.label_suffix
+
 
 class CLAUDEParser:
     """Parse CLAUDE.md files into hierarchical sections"""
@@ -77,6 +104,7 @@ class CLAUDEParser:
         self.file_path = Path(file_path)
         self.lines = []
         self.sections = []
+        self.all_sections = []  # Every section in document order
 
     def parse(self) -> List[Section]:
         """Parse the CLAUDE.md file and return sections"""
@@ -84,15 +112,21 @@ class CLAUDEParser:
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
         with open(self.file_path, "r", encoding="utf-8") as f:
-            self.lines = f.readlines()
+            text = f.read()
+        self.lines = _LINE_RE.findall(text)
+        # Offset just past each line, to map a match position to its line index
+        line_ends = list(accumulate(map(len, self.lines)))
 
         self.sections = []
         current_sections = []  # Stack to track hierarchy
         in_code_block = False
 
-        for i, line in enumerate(self.lines):
+        # Only fence and header lines are visited; the regex skips the rest. A
+        # match starts at the newline just before its line, one character early
+        # in the padded text, which is exactly the line's offset in "text"
+        for match in _EVENT_RE.finditer("\n" + text):
             # Track code blocks to avoid parsing headers inside them
-            if line.strip().startswith("```"):
+            if match.group("fence"):
                 in_code_block = not in_code_block
                 continue
 
@@ -100,37 +134,39 @@ class CLAUDEParser:
             if in_code_block:
                 continue
 
-            header_match = re.match(r"^(#{1,6})\s+(.+)$", line.strip())
-            if header_match:
-                level = len(header_match.group(1))
-                title = header_match.group(2).strip()
-
-                # Close any sections at same or higher level
-                while current_sections and current_sections[-1].level >= level:
-                    section = current_sections.pop()
-                    section.line_end = i - 1
-
-                # Create new section
-                section = Section(
-                    level=level,
-                    title=title,
-                    line_start=i,
-                    line_end=len(self.lines) - 1,  # Will be updated when section ends
-                )
+            i = bisect_right(line_ends, match.start())
+            level = len(match.group("hashes"))
+            title = match.group("title")
+
+            # Close any sections at same or higher level
+            while current_sections and current_sections[-1].level >= level:
+                section = current_sections.pop()
+                section.line_end = i - 1
+
+            # Create new section
+            section = Section(
+                level=level,
+                title=title,
+                line_start=i,
+                line_end=len(self.lines) - 1,  # Will be updated when section ends
+            )
 
-                # Set parent relationship
-                if current_sections:
-                    section.parent = current_sections[-1]
-                    current_sections[-1].children.append(section)
-                else:
-                    self.sections.append(section)
+            # Set parent relationship
+            if current_sections:
+                section.parent = current_sections[-1]
+                section.parent.children.append(section)
+                section.parent.label_suffix = _SUBSECTIONS_SUFFIX
+            else:
+                self.sections.append(section)
 
-                current_sections.append(section)
+            current_sections.append(section)
 
         # Close remaining sections
         for section in current_sections:
             section.line_end = len(self.lines) - 1
 
+        self.all_sections = self._flatten_sections(self.sections)
+
         # Extract content for each section
         self._extract_content()
 
@@ -138,40 +174,28 @@ class CLAUDEParser:
 
     def _extract_content(self):
         """Extract content lines for each section"""
-        all_sections = self._flatten_sections(self.sections)
-
-        for section in all_sections:
-            start = section.line_start
-            end = section.line_end + 1
-
-            # Find the actual content end (next section start)
-            for other in all_sections:
-                if other.line_start > start and other.line_start < end:
-                    end = other.line_start
-                    break
-
-            section.content_lines = self.lines[start:end]
+        # Flattening yields sections in document order, so a section's own
+        # content ends where the next section in the list starts
+        all_sections = self.all_sections
+        next_starts = [section.line_start for section in all_sections[1:]]
+        next_starts.append(len(self.lines))
+
+        for section, end in zip(all_sections, next_starts):
+            section.content_lines = self.lines[section.line_start : end]
             section.line_end = end - 1
 
     def _flatten_sections(self, sections: List[Section]) -> List[Section]:
-        """Flatten nested sections into a single list"""
+        """Flatten nested sections into a single list, in document order"""
         result = []
-        for section in sections:
+        stack = list(reversed(sections))
+        while stack:
+            section = stack.pop()
             result.append(section)
-            result.extend(self._flatten_sections(section.children))
+            stack.extend(reversed(section.children))
         return result
 
 
-class HelpScreen(ModalScreen):
-    """Help screen showing keyboard shortcuts"""
-
-    BINDINGS = [
-        Binding("escape", "close", "Close"),
-        Binding("q", "close", "Close"),
-    ]
-
-    def compose(self) -> ComposeResult:
-        help_text = """
+_HELP_TEXT: Final[str] = """
 ┌─ CLAUDE.md Menuconfig Help ─────────────────────────────────────────┐
 │                                                                     │
 │ Navigation:                                                         │
@@ -202,7 +226,17 @@ class HelpScreen(ModalScreen):
 └─────────────────────────────────────────────────────────────────────┘
         """
 
-        yield Container(Static(help_text, id="help-text"), id="help-container")
+
+class HelpScreen(ModalScreen):
+    """Help screen showing keyboard shortcuts"""
+
+    BINDINGS = [
+        Binding("escape", "close", "Close"),
+        Binding("q", "close", "Close"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        yield Container(Static(_HELP_TEXT, id="help-text"), id="help-container")
 
     def action_close(self) -> None:
         self.dismiss()
@@ -216,9 +250,10 @@ class SearchScreen(ModalScreen):
         Binding("enter", "search", "Search"),
     ]
 
-    def __init__(self, sections: List[Section]):
+    def __init__(self, sections: List[Section], lower_titles: List[str]):
         super().__init__()
-        self.sections = sections
+        self.sections = sections  # Every section, flattened in document order
+        self.lower_titles = lower_titles  # Lowercased titles, parallel to sections
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -242,11 +277,11 @@ class SearchScreen(ModalScreen):
         search_term = self.query_one("#search-input").value.lower()
         if search_term:
             # Find matching sections
-            matches = []
-            all_sections = self._flatten_sections(self.sections)
-            for section in all_sections:
-                if search_term in section.title.lower():
-                    matches.append(section)
+            matches = [
+                section
+                for section, title in zip(self.sections, self.lower_titles)
+                if search_term in title
+            ]
             self.dismiss(matches)
         else:
             self.dismiss(None)
@@ -259,14 +294,6 @@ class SearchScreen(ModalScreen):
     def on_cancel_button(self) -> None:
         self.action_close()
 
-    def _flatten_sections(self, sections: List[Section]) -> List[Section]:
-        """Flatten nested sections into a single list"""
-        result = []
-        for section in sections:
-            result.append(section)
-            result.extend(self._flatten_sections(section.children))
-        return result
-
 
 class MenuconfigTree(Tree):
     """Custom tree widget for menuconfig interface"""
@@ -281,38 +308,56 @@ class MenuconfigTree(Tree):
     def __init__(self, sections: List[Section], **kwargs):
         super().__init__("CLAUDE.md Configuration", **kwargs)
         self.sections = sections
-        self.section_nodes = {}  # Map section to tree node
         self._build_tree()
 
     def _build_tree(self):
         """Build the tree from sections"""
+        # Only root sections get nodes up front; subsections are added the
+        # first time their parent is expanded
+        for section in self.sections:
+            self._add_section_node(section, self.root)
 
-        def add_section(section: Section, parent_node):
-            state_char = "*" if section.enabled else " "
-            subsection_indicator = " --->" if section.children else ""
+        # Expand root
+        self.root.expand()
 
-            label = f"[{state_char}] {section.title}{subsection_indicator}"
-            node = parent_node.add(label, data=section)
-            self.section_nodes[section] = node
+    def _add_section_node(self, section: Section, parent_node):
+        """Add a node for a section, without its subsections"""
+        # A Text label is used as is, where a str would be parsed as markup
+        node = parent_node.add(
+            Text(section.label), data=section, allow_expand=bool(section.children)
+        )
+        section.tree_node = node
 
-            # Add children
+    def _add_child_nodes(self, node):
+        """Add nodes for a section's subsections unless already added"""
+        section = node.data
+        if section is not None and not node.children:
             for child in section.children:
-                add_section(child, node)
+                self._add_section_node(child, node)
 
-        # Add root sections
-        for section in self.sections:
-            add_section(section, self.root)
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Populate a section's subsections when it is first expanded"""
+        self._add_child_nodes(event.node)
 
-        # Expand root
-        self.root.expand()
+    def reveal_section(self, section: Section):
+        """Return the node for a section, adding and expanding its ancestors"""
+        ancestors = []
+        parent = section.parent
+        while parent is not None:
+            ancestors.append(parent)
+            parent = parent.parent
+
+        for ancestor in reversed(ancestors):
+            node = ancestor.tree_node
+            self._add_child_nodes(node)
+            node.expand()
+
+        return section.tree_node
 
     def update_section_label(self, section: Section):
         """Update the label for a section after toggle"""
-        if section in self.section_nodes:
-            node = self.section_nodes[section]
-            state_char = "*" if section.enabled else " "
-            subsection_indicator = " --->" if section.children else ""
-            node.label = f"[{state_char}] {section.title}{subsection_indicator}"
+        if section.tree_node is not None:
+            section.tree_node.label = Text(section.label)
 
     def action_toggle_section(self) -> None:
         """Toggle the currently selected section"""
@@ -405,6 +450,9 @@ class MenuconfigApp(App):
         self.parser = CLAUDEParser(file_path)
         self.sections = []
         self.original_content = ""
+        self._lower_titles = []  # Search index, built once after parsing
+        self._status_timer = None  # Pending debounced status update
+        self._status_texts = self._build_status_texts()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -426,6 +474,10 @@ class MenuconfigApp(App):
 
             # Parse sections
             self.sections = self.parser.parse()
+            self._lower_titles = [
+                section.title.lower() for section in self.parser.all_sections
+            ]
+            self._status_texts = self._build_status_texts()
 
             # Replace loading message with tree
             main_container = self.query_one("#main-container")
@@ -447,13 +499,19 @@ class MenuconfigApp(App):
 
     def _get_status_text(self) -> str:
         """Get status bar text"""
-        modified_text = " [MODIFIED]" if self.modified else ""
-        sections_text = (
-            f" | {len(self.sections)} sections loaded"
-            if hasattr(self, "sections")
-            else ""
+        unmodified_text, modified_text = self._status_texts
+        return modified_text if self.modified else unmodified_text
+
+    def _build_status_texts(self) -> Tuple[str, str]:
+        """Build the status bar text for the unmodified and modified states"""
+        sections_text = f" | {len(self.sections)} sections loaded"
+        help_text = (
+            " | Use arrow keys to navigate, Space to toggle, 's' to save, '?' for help"
+        )
+        return (
+            f"File: {self.file_path}{sections_text}{help_text}",
+            f"File: {self.file_path} [MODIFIED]{sections_text}{help_text}",
         )
-        return f"File: {self.file_path}{modified_text}{sections_text} | Use arrow keys to navigate, Space to toggle, 's' to save, '?' for help"
 
     def _update_status(self) -> None:
         """Update status bar"""
@@ -480,11 +538,14 @@ class MenuconfigApp(App):
             if matches:
                 # Focus on first match
                 tree = self.query_one("#config-tree", MenuconfigTree)
-                first_match = matches[0]
-                if first_match in tree.section_nodes:
-                    tree.select_node(tree.section_nodes[first_match])
+                node = tree.reveal_section(matches[0])
+                # Node positions are only known once the tree has re-rendered
+                tree.call_after_refresh(tree.select_node, node)
 
-        self.push_screen(SearchScreen(self.sections), handle_search_result)
+        self.push_screen(
+            SearchScreen(self.parser.all_sections, self._lower_titles),
+            handle_search_result,
+        )
 
     def action_save(self) -> None:
         """Save configuration to file"""
@@ -512,46 +573,66 @@ class MenuconfigApp(App):
     ) -> None:
         """Handle section toggle"""
         self.modified = True
+        if self._status_timer is None:
+            self._status_timer = self.set_timer(
+                _STATUS_DEBOUNCE, self._flush_status_update
+            )
+
+    def _flush_status_update(self) -> None:
+        """Run the status update scheduled by a toggle"""
+        self._status_timer = None
         self._update_status()
 
     def _save_configuration(self) -> None:
         """Save the current configuration to CLAUDE.md"""
-        # Create backup
-        backup_path = self.file_path.with_suffix(".md.menuconfig.bak")
-        shutil.copy2(self.file_path, backup_path)
+        # The new content replaces the real file, even if CLAUDE.md is a symlink
+        target = self.file_path.resolve()
+        tmp_path = target.with_name(target.name + ".menuconfig.tmp")
 
-        # Generate new content
-        new_content = self._generate_content()
+        # Create backup. The original is replaced rather than overwritten, so a
+        # hard link to it is enough; copy only where linking is not possible
+        backup_path = self.file_path.with_suffix(".md.menuconfig.bak")
+        if backup_path.exists() or backup_path.is_symlink():
+            backup_path.unlink()
+        try:
+            os.link(target, backup_path)
+        except OSError:
+            shutil.copy2(target, backup_path)
 
-        # Write to file
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            f.write(new_content)
+        # Stream the new content to a temporary file, without joining it in
+        # memory, then rename it over the original so a failed save never
+        # leaves a truncated CLAUDE.md behind
+        try:
+            with open(tmp_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+                f.writelines(self._iter_content())
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(target, tmp_path)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        os.replace(tmp_path, target)
 
-    def _generate_content(self) -> str:
-        """Generate CLAUDE.md content based on enabled sections"""
-        lines = []
+    def _iter_content(self) -> Iterator[str]:
+        """Yield the CLAUDE.md lines of the enabled sections"""
 
-        def add_section(section: Section, content_lines: List[str]):
+        def iter_section(section: Section) -> Iterator[str]:
             if section.enabled:
                 # Add section header
-                lines.append(section.full_title + "\n")
+                yield section.full_title + "\n"
 
-                # Add section content (excluding the header line and subsequent headers)
-                for i, line in enumerate(section.content_lines[1:], 1):
-                    # Skip if this line is a header that starts another section
-                    if re.match(r"^#{1,6}\s+", line.strip()):
-                        continue
-                    lines.append(line)
+                # Add section content; content_lines already stops before the
+                # next section's header, so only the header line is skipped
+                yield from section.content_lines[1:]
 
                 # Add enabled children
                 for child in section.children:
-                    add_section(child, content_lines)
+                    yield from iter_section(child)
 
         # Process all root sections
         for section in self.sections:
-            add_section(section, self.parser.lines)
-
-        return "".join(lines)
+            yield from iter_section(section)
 
 
 class MenuconfigCommand(BaseCommand):
@@ -560,27 +641,22 @@ class MenuconfigCommand(BaseCommand):
     inspired by Linux kernel menuconfig.
     """
 
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "menuconfig"
-
-    @property
-    def help_text(self) -> str:
-        """Return the help text for the command."""
-        return (
-            "Interactive menuconfig-style TUI editor for CLAUDE.md files with "
-            "Linux kernel menuconfig look and feel.\n\n"
-            "Examples:\n"
-            "  /menuconfig                        # Edit project/global CLAUDE.md\n"
-            "  /menuconfig custom.md              # Edit specific file\n"
-            "  claude-slash menuconfig            # CLI mode\n\n"
-            "Features:\n"
-            "• Linux kernel menuconfig-inspired interface\n"
-            "• Navigate sections with keyboard shortcuts\n"
-            "• Toggle sections enabled/disabled\n"
-            "• Real-time preview and editing"
-        )
+    __slots__ = ()
+
+    name = "menuconfig"
+    help_text = (
+        "Interactive menuconfig-style TUI editor for CLAUDE.md files with "
+        "Linux kernel menuconfig look and feel.\n\n"
+        "Examples:\n"
+        "  /menuconfig                        # Edit project/global CLAUDE.md\n"
+        "  /menuconfig custom.md              # Edit specific file\n"
+        "  claude-slash menuconfig            # CLI mode\n\n"
+        "Features:\n"
+        "• Linux kernel menuconfig-inspired interface\n"
+        "• Navigate sections with keyboard shortcuts\n"
+        "• Toggle sections enabled/disabled\n"
+        "• Real-time preview and editing"
+    )
 
     def execute(self, **kwargs: Any) -> None:
         """
@@ -623,6 +699,7 @@ class MenuconfigCommand(BaseCommand):
 
     def create_typer_command(self):
         """Create a Typer command with custom arguments."""
+        import typer
 
         def command_wrapper(
             file: Optional[str] = typer.Argument(
@@ -631,27 +708,10 @@ class MenuconfigCommand(BaseCommand):
             )
         ) -> None:
             """Interactive menuconfig-style editor for CLAUDE.md files with Linux kernel menuconfig look and feel."""
-            try:
-                self.execute(file=file)
-            except Exception as e:
-                self.console.print(
-                    f"[bold red]Error executing {self.name}:[/bold red] {str(e)}"
-                )
-                raise typer.Exit(1)
+            self.execute(file=file)
 
         return command_wrapper
 
     def _get_git_root(self) -> Path:
         """Get the git repository root, or current directory if not in a git repo."""
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return Path(result.stdout.strip())
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return Path.cwd()
+        return find_git_root(os.getcwd()) or Path.cwd()
@@ -8,41 +8,194 @@ This module provides the main slash command that:
 
 import json
 import os
+import re
 import shutil
 import subprocess
+import tarfile
 import tempfile
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional
 
-import typer
+from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
 
 from ..ui import SpinnerManager, track_operation
+from ._cache import read_cache, write_cache
+from ._git import find_git_root
 from .base import BaseCommand
 
+# Below this many command files, help and update handle them serially; a pool
+# isn't worth it
+_PARALLEL_FILE_THRESHOLD = 16
+_MAX_FILE_WORKERS = 16
+
+# Release endpoints are public, so they are requested anonymously; gh (and its
+# authenticated rate limit) is only used once the anonymous limit is exhausted
+_API_URL = "https://api.github.com/"
+_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "claude-slash",
+}
+_API_TIMEOUT = 30
+
+# Latest-release lookups are cached; within the TTL no request is made at all,
+# after it the cached ETag turns an unchanged release into a 304
+_LATEST_RELEASE_ENDPOINT = "repos/jeremyeder/claude-slash/releases/latest"
+_TARBALL_ENDPOINT = "repos/jeremyeder/claude-slash/tarball/{}"
+_RELEASE_CACHE = "slash-latest-release.json"
+_RELEASE_CACHE_TTL = 5 * 60
+
+# Records the installed release tag inside the install directory
+_VERSION_FILE = ".version"
+
+# Release tarball members needed by an update, relative to the repository root
+_COMMANDS_PREFIX = ".claude/commands/"
+
+# Reject unsafe tarball members where tarfile supports extraction filters
+_EXTRACT_FILTER = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+# Command file metadata patterns. Lines are compared stripped, so each line
+# pattern allows horizontal whitespace around it.
+_WS = r"[^\S\n]*"
+_DESC_HEADER_RE = re.compile(rf"^{_WS}## Description[^\n]*\n", re.MULTILINE)
+# Matched right after the header: blank lines, "#" headings and repeated
+# Description headers are skipped, and any other "##" heading ends the search
+_DESC_RE = re.compile(
+    rf"(?:{_WS}(?:#(?!#)[^\n]*|## Description[^\n]*)?{_WS}\n)*?"
+    rf"{_WS}([^#\s][^\n]*?){_WS}$",
+    re.MULTILINE,
+)
+# Matched from the start so code fences pair up: usage is the first line
+# starting with "/" inside a fenced block
+_OUTSIDE_LINE = rf"(?!{_WS}```)[^\n]*\n"
+_INSIDE_LINE = rf"(?!{_WS}(?:```|/))[^\n]*\n"
+_FENCE_LINE = rf"{_WS}```[^\n]*\n"
+_USAGE_RE = re.compile(
+    rf"(?:{_OUTSIDE_LINE})*"
+    rf"(?:{_FENCE_LINE}(?:{_INSIDE_LINE})*{_FENCE_LINE}(?:{_OUTSIDE_LINE})*)*"
+    rf"{_FENCE_LINE}(?:{_INSIDE_LINE})*{_WS}(/[^\n]*?){_WS}$",
+    re.MULTILINE,
+)
+
+
+def _open_api(endpoint: str, headers: Optional[dict[str, str]] = None) -> Any:
+    """
+    Send an anonymous GET request to a GitHub API endpoint.
+
+    Returns:
+        The open HTTP response; redirects (such as tarball downloads) are
+        followed
+
+    Raises:
+        urllib.error.HTTPError: For error statuses, including 304
+        urllib.error.URLError: If the API cannot be reached
+    """
+    request = urllib.request.Request(
+        _API_URL + endpoint, headers={**_API_HEADERS, **(headers or {})}
+    )
+    return urllib.request.urlopen(request, timeout=_API_TIMEOUT)
+
+
+def _is_rate_limited(error: urllib.error.HTTPError) -> bool:
+    """Return whether an API error means the anonymous rate limit was hit."""
+    if error.code == 429:
+        return True
+    return error.code == 403 and error.headers.get("X-RateLimit-Remaining") == "0"
+
+
+def _split_http_response(output: str) -> tuple[int, dict[str, str], str]:
+    """
+    Split ``gh api --include`` output into status, headers and body.
+
+    Returns:
+        Tuple of (status, headers, body); header names are lowercased, and the
+        status is 0 if the output does not start with a status line
+    """
+    head, _, body = output.partition("\n\n")
+    status_line, *header_lines = head.split("\n")
+    parts = status_line.split()
+    status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+@lru_cache(maxsize=8)
+def _locate_commands_directory(cwd: str, home: str) -> Optional[str]:
+    """Find the commands directory (project or global), memoized per directory."""
+    # Try to get git root first
+    git_root = find_git_root(cwd)
+    if git_root:
+        commands_dir = os.path.join(git_root, ".claude", "commands")
+        if os.path.isdir(commands_dir):
+            return commands_dir
+
+    # Fall back to current directory
+    commands_dir = os.path.join(cwd, ".claude", "commands")
+    if os.path.isdir(commands_dir):
+        return commands_dir
+
+    # Try global installation
+    global_dir = os.path.join(home, ".claude", "commands")
+    if os.path.isdir(global_dir):
+        return global_dir
+
+    return None
+
+
+@lru_cache(maxsize=8)
+def _locate_installation(cwd: str, home: str) -> tuple[Optional[str], str]:
+    """Detect the installation directory and type, memoized per directory."""
+    # Check project installation
+    project_dir = os.path.join(cwd, ".claude", "commands")
+    if os.path.isdir(project_dir):
+        return project_dir, "project"
+
+    # Check global installation
+    global_dir = os.path.join(home, ".claude", "commands")
+    if os.path.isdir(global_dir):
+        return global_dir, "global"
+
+    return None, ""
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hard link ``src`` to ``dst``, copying it where linking is not possible.
+
+    Used for the update backup: the update unlinks old command files and
+    writes new ones rather than modifying files in place, so a linked backup
+    keeps the old contents without copying any bytes.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class SlashCommand(BaseCommand):
     """
     Main slash command providing help display and update functionality.
     """
 
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "slash"
-
-    @property
-    def help_text(self) -> str:
-        """Return the help text for the command."""
-        return (
-            "Display Rich-formatted help with all available commands, or update "
-            "to the latest release with progress tracking.\n\n"
-            "Examples:\n"
-            "  /slash              # Show help with all commands\n"
-            "  /slash update       # Update to latest release\n"
-            "  claude-slash slash  # Show help (CLI mode)"
-        )
+    __slots__ = ()
+
+    name = "slash"
+    help_text = (
+        "Display Rich-formatted help with all available commands, or update "
+        "to the latest release with progress tracking.\n\n"
+        "Examples:\n"
+        "  /slash              # Show help with all commands\n"
+        "  /slash update       # Update to latest release\n"
+        "  claude-slash slash  # Show help (CLI mode)"
+    )
 
     def execute(self, **kwargs: Any) -> None:
         """
@@ -60,6 +213,7 @@ class SlashCommand(BaseCommand):
 
     def create_typer_command(self):
         """Create a Typer command with custom arguments."""
+        import typer
 
         def command_wrapper(
             subcommand: Optional[str] = typer.Argument(
@@ -67,28 +221,22 @@ class SlashCommand(BaseCommand):
             )
         ) -> None:
             """Show help and available commands or update to latest release."""
-            try:
-                self.execute(subcommand=subcommand)
-            except Exception as e:
-                self.console.print(
-                    f"[bold red]Error executing {self.name}:[/bold red] {str(e)}"
-                )
-                raise typer.Exit(1)
+            self.execute(subcommand=subcommand)
 
         return command_wrapper
 
     def _handle_help(self) -> None:
         """Handle the help subcommand (default behavior)."""
-        self.console.print(
-            Panel(
-                "[bold blue]📋 Available Claude Slash Commands[/bold blue]",
-                style="blue",
-            )
+        console = self.console
+        header = Panel(
+            "[bold blue]📋 Available Claude Slash Commands[/bold blue]",
+            style="blue",
         )
 
         # Get the commands directory
         commands_dir = self._find_commands_directory()
         if not commands_dir:
+            console.print(header)
             self.error(
                 "❌ No claude-slash commands found\n"
                 "Install commands by downloading and running install.sh from:\n"
@@ -96,29 +244,39 @@ class SlashCommand(BaseCommand):
             )
             return
 
-        self.console.print(f"[cyan]Commands installed in: {commands_dir}[/cyan]")
-        self.console.print()
-
         # Create a table for commands
         table = Table(show_header=True, header_style="bold green")
         table.add_column("Command", style="cyan")
         table.add_column("Description")
 
-        # Process all command files
-        command_files = list(Path(commands_dir).glob("*.md"))
-        if not command_files:
+        # Process all command files; one scandir pass lists and filters them
+        with os.scandir(commands_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries if entry.name.endswith(".md")
+            )
+        if not names:
+            console.print(header)
+            console.print(f"[cyan]Commands installed in: {commands_dir}[/cyan]")
+            console.print()
             self.warning("No command files found in commands directory")
             return
 
-        for cmd_file in sorted(command_files):
-            filename = cmd_file.stem
+        # Skip this help command to avoid recursion
+        command_files = [
+            Path(commands_dir, name) for name in names if name != "slash.md"
+        ]
 
-            # Skip this help command to avoid recursion
-            if filename == "slash":
-                continue
+        # Reading many files overlaps well on a thread pool; map keeps the order
+        if len(command_files) < _PARALLEL_FILE_THRESHOLD:
+            metadata = map(self._extract_metadata, command_files)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_FILE_WORKERS, len(command_files))
+            ) as pool:
+                metadata = list(pool.map(self._extract_metadata, command_files))
 
-            description = self._extract_description(cmd_file)
-            usage = self._extract_usage(cmd_file)
+        for cmd_file, (description, usage) in zip(command_files, metadata):
+            filename = cmd_file.stem
 
             # Format the command name
             if usage:
@@ -132,10 +290,7 @@ class SlashCommand(BaseCommand):
 
             table.add_row(cmd_display, description)
 
-        self.console.print(table)
-        self.console.print()
-
-        # Print tips
+        # Tips panel
         tips_panel = Panel(
             "[yellow]💡 Tips:[/yellow]\n"
             "• Type any command above to use it\n"
@@ -143,11 +298,24 @@ class SlashCommand(BaseCommand):
             "• Use /slash update to get the latest commands",
             style="yellow",
         )
-        self.console.print(tips_panel)
 
-        self.console.print()
-        self.console.print(
-            "[blue]📖 For more information visit:[/blue] https://github.com/jeremyeder/claude-slash"
+        # Rendered as one group so the whole help is written out at once; strings
+        # go through render_str to keep print()'s markup and highlighting
+        console.print(
+            Group(
+                header,
+                console.render_str(
+                    f"[cyan]Commands installed in: {commands_dir}[/cyan]"
+                ),
+                "",
+                table,
+                "",
+                tips_panel,
+                "",
+                console.render_str(
+                    "[blue]📖 For more information visit:[/blue] https://github.com/jeremyeder/claude-slash"
+                ),
+            )
         )
 
     def _handle_update(self) -> None:
@@ -167,27 +335,20 @@ class SlashCommand(BaseCommand):
 
         self.console.print(f"📍 Found {install_type} installation at: {install_dir}")
 
-        # Check for latest release using gh CLI with spinner
+        # Check for latest release with spinner
         with SpinnerManager.network_operation(
             "🔍 Checking for latest release..."
         ) as status:
             try:
-                result = subprocess.run(
-                    ["gh", "api", "repos/jeremyeder/claude-slash/releases/latest"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                latest_info = json.loads(result.stdout)
-                latest_tag = latest_info.get("tag_name")
+                latest_tag = self._fetch_latest_tag()
 
                 if not latest_tag:
                     self.error("❌ Could not determine latest version")
                     return
 
-            except subprocess.CalledProcessError:
+            except (subprocess.CalledProcessError, OSError):
                 self.error(
-                    "❌ Failed to check for updates (network error or gh CLI not available)"
+                    "❌ Failed to check for updates (network error or GitHub unavailable)"
                 )
                 return
             except json.JSONDecodeError:
@@ -196,49 +357,33 @@ class SlashCommand(BaseCommand):
 
         self.console.print(f"📦 Latest release: {latest_tag}")
 
+        # Nothing to back up or download when that release is already installed
+        version_file = Path(install_dir, _VERSION_FILE)
+        try:
+            installed_tag = version_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            installed_tag = None
+        if installed_tag == latest_tag:
+            self.console.print(f"✅ Already up to date ({latest_tag})")
+            return
+
         # Create backup
         backup_dir = f"{install_dir}.backup.{self._get_timestamp()}"
         self.console.print(f"💾 Creating backup at: {backup_dir}")
         try:
-            shutil.copytree(install_dir, backup_dir)
+            shutil.copytree(install_dir, backup_dir, copy_function=_link_or_copy)
         except Exception as e:
             self.error(f"❌ Failed to create backup: {e}")
             return
 
-        # Download and extract latest release using gh CLI with progress tracking
+        # Download and extract latest release with progress tracking
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
-                # Download the tarball using gh CLI with spinner
+                # Download the tarball and extract it as it arrives, with spinner
                 with SpinnerManager.network_operation(
-                    "⬇️ Downloading latest release..."
-                ):
-                    tarball_path = os.path.join(temp_dir, "claude-slash.tar.gz")
-                    subprocess.run(
-                        [
-                            "gh",
-                            "api",
-                            f"repos/jeremyeder/claude-slash/tarball/{latest_tag}",
-                        ],
-                        stdout=open(tarball_path, "wb"),
-                        check=True,
-                    )
-
-                # Extract the tarball with spinner
-                with SpinnerManager.file_operation(
-                    "📦 Extracting release..."
+                    "⬇️ Downloading and extracting latest release..."
                 ):
-                    subprocess.run(
-                        [
-                            "tar",
-                            "-xz",
-                            "-C",
-                            temp_dir,
-                            "--strip-components=1",
-                            "-f",
-                            tarball_path,
-                        ],
-                        check=True,
-                    )
+                    self._download_commands(latest_tag, temp_dir)
 
                 # Update commands with progress
                 commands_source = os.path.join(temp_dir, ".claude", "commands")
@@ -253,15 +398,22 @@ class SlashCommand(BaseCommand):
                         total=total_operations,
                         operation_type="file",
                     ) as (progress, task):
-                        # Remove old commands
-                        for md_file in old_files:
-                            md_file.unlink()
-                            progress.update(task, advance=1)
+                        # Remove old commands, all before any new one is copied
+                        self._run_file_operations(
+                            Path.unlink, old_files, progress, task
+                        )
 
                         # Copy new commands
-                        for md_file in new_files:
-                            shutil.copy2(md_file, install_dir)
-                            progress.update(task, advance=1)
+                        self._run_file_operations(
+                            lambda md_file: shutil.copy2(md_file, install_dir),
+                            new_files,
+                            progress,
+                            task,
+                        )
+
+                    # Replace rather than rewrite: the backup may hard link it
+                    version_file.unlink(missing_ok=True)
+                    version_file.write_text(f"{latest_tag}\n", encoding="utf-8")
 
                     self.console.print("✅ Update completed successfully!")
                     self.console.print(f"📦 Updated to: {latest_tag}")
@@ -275,7 +427,7 @@ class SlashCommand(BaseCommand):
                     shutil.move(backup_dir, install_dir)
                     return
 
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, urllib.error.URLError) as e:
                 self.error(f"❌ Failed to download release: {e}")
                 # Restore from backup
                 self.console.print("🔄 Restoring from backup...")
@@ -293,121 +445,237 @@ class SlashCommand(BaseCommand):
         self.console.print()
         self.console.print("🎉 claude-slash commands updated successfully!")
 
-    def _find_commands_directory(self) -> Optional[str]:
-        """Find the commands directory (project or global)."""
-        # Try to get git root first
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            git_root = result.stdout.strip()
-            commands_dir = os.path.join(git_root, ".claude", "commands")
-            if os.path.isdir(commands_dir):
-                return commands_dir
-        except subprocess.CalledProcessError:
-            pass
-
-        # Fall back to current directory
-        commands_dir = os.path.join(os.getcwd(), ".claude", "commands")
-        if os.path.isdir(commands_dir):
-            return commands_dir
+    def _fetch_latest_tag(self) -> Optional[str]:
+        """
+        Look up the tag of the latest release.
 
-        # Try global installation
-        global_dir = os.path.join(os.path.expanduser("~"), ".claude", "commands")
-        if os.path.isdir(global_dir):
-            return global_dir
+        A tag checked within the last few minutes is reused without a request.
+        An older one is revalidated with its ETag, so an unchanged release
+        costs a 304 response without a body.
 
-        return None
+        Returns:
+            The latest release tag, or None if the release has none
 
-    def _detect_installation(self) -> tuple[Optional[str], str]:
+        Raises:
+            OSError: If the release cannot be queried
+            subprocess.CalledProcessError: If the gh fallback fails
+            json.JSONDecodeError: If the release information is malformed
         """
-        Detect installation type and location.
+        cached = self._read_release_cache(_RELEASE_CACHE_TTL)
+        if cached:
+            return cached["tag"]
+
+        headers = {}
+        stale = self._read_release_cache(float("inf"))
+        if stale and stale.get("etag"):
+            headers["If-None-Match"] = stale["etag"]
+
+        status, etag, body = self._request_latest_release(headers)
+        if status == 304 and stale:
+            write_cache(_RELEASE_CACHE, json.dumps(stale))
+            return stale["tag"]
+
+        latest_tag = json.loads(body).get("tag_name")
+        if latest_tag:
+            entry = {"tag": latest_tag, "etag": etag}
+            write_cache(_RELEASE_CACHE, json.dumps(entry))
+        return latest_tag
+
+    def _request_latest_release(
+        self, headers: dict[str, str]
+    ) -> tuple[int, Optional[str], str]:
+        """
+        Request the latest release, falling back to gh when rate limited.
 
         Returns:
-            Tuple of (install_dir, install_type) or (None, "") if not found
-        """
-        # Check project installation
-        project_dir = os.path.join(os.getcwd(), ".claude", "commands")
-        if os.path.isdir(project_dir):
-            return project_dir, "project"
+            Tuple of (status, etag, body); a 304 is returned, not raised
 
-        # Check global installation
-        global_dir = os.path.join(os.path.expanduser("~"), ".claude", "commands")
-        if os.path.isdir(global_dir):
-            return global_dir, "global"
+        Raises:
+            urllib.error.URLError: If the API request fails otherwise
+            subprocess.CalledProcessError: If the gh fallback fails
+        """
+        try:
+            with _open_api(_LATEST_RELEASE_ENDPOINT, headers) as response:
+                return (
+                    response.status,
+                    response.headers.get("ETag"),
+                    response.read().decode("utf-8"),
+                )
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, None, ""
+            if not _is_rate_limited(e):
+                raise
+
+        args = ["gh", "api", "--include", _LATEST_RELEASE_ENDPOINT]
+        for name, value in headers.items():
+            args += ["--header", f"{name}: {value}"]
+
+        # gh exits non-zero on a 304, so the status line decides, not the exit code
+        result = subprocess.run(args, capture_output=True, text=True)
+        status, response_headers, body = _split_http_response(result.stdout)
+        if status == 304:
+            return 304, None, ""
+        if result.returncode:
+            raise subprocess.CalledProcessError(
+                result.returncode, args, result.stdout, result.stderr
+            )
+        return status, response_headers.get("etag"), body
 
-        return None, ""
+    def _read_release_cache(self, ttl: float) -> Optional[dict]:
+        """Return the cached latest-release entry younger than ``ttl``, if any."""
+        cached = read_cache(_RELEASE_CACHE, ttl)
+        if cached:
+            try:
+                entry = json.loads(cached)
+            except ValueError:
+                return None
+            if isinstance(entry, dict) and entry.get("tag"):
+                return entry
+        return None
 
-    def _extract_description(self, file_path: Path) -> str:
+    def _download_commands(self, tag: str, dest: str) -> None:
         """
-        Extract command description from markdown file.
+        Stream a release tarball into ``dest``.
+
+        The archive is extracted straight from the HTTP response and never
+        written to disk. When the anonymous API rate limit is exhausted, it
+        is streamed from gh instead.
 
         Args:
-            file_path: Path to the markdown command file
+            tag: Release tag to download
+            dest: Directory to extract into
 
-        Returns:
-            Extracted description or default text
+        Raises:
+            urllib.error.URLError: If the tarball cannot be downloaded
+            subprocess.CalledProcessError: If the gh fallback fails
         """
+        endpoint = _TARBALL_ENDPOINT.format(tag)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Try to get the first line after the title that contains descriptive text
-            if len(lines) >= 3:
-                description = lines[2].strip()
-                if description and len(description) >= 10:
-                    return description
-
-            # If that's empty or too short, look for the Description section
-            in_description = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith("## Description"):
-                    in_description = True
+            response = _open_api(endpoint)
+        except urllib.error.HTTPError as e:
+            if not _is_rate_limited(e):
+                raise
+        else:
+            with response:
+                self._extract_commands(response, dest)
+            return
+
+        args = ["gh", "api", endpoint]
+        with subprocess.Popen(args, stdout=subprocess.PIPE) as proc:
+            try:
+                self._extract_commands(proc.stdout, dest)
+            except tarfile.TarError:
+                # A truncated or empty stream usually means gh itself failed
+                proc.stdout.close()
+                if proc.wait():
+                    raise subprocess.CalledProcessError(proc.returncode, args)
+                raise
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, args)
+
+    def _extract_commands(self, stream: Any, dest: str) -> None:
+        """
+        Extract the command files from a gzipped tarball stream into ``dest``.
+
+        Like ``tar --strip-components=1``, the top-level directory of each
+        member is dropped, and only the command files are extracted.
+        """
+        with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+            for member in tar:
+                name = member.name.partition("/")[2]
+                if not name.startswith(_COMMANDS_PREFIX):
                     continue
-                if in_description and line.startswith("##"):
-                    break
-                if in_description and line and not line.startswith("#"):
-                    return line[:80]
+                member.name = name
+                if member.islnk():
+                    member.linkname = member.linkname.partition("/")[2]
+                tar.extract(member, dest, **_EXTRACT_FILTER)
+
+    def _run_file_operations(
+        self,
+        operation: Callable[[Path], Any],
+        paths: List[Path],
+        progress: Any,
+        task: Any,
+    ) -> None:
+        """
+        Apply a file operation to each path, advancing the progress bar.
 
-            # Fallback to a generic description
-            return "Custom claude-slash command"
+        Many files are handled on a thread pool so their syscalls overlap;
+        the first failure is raised once all submitted operations finish.
 
-        except Exception:
-            return "Custom claude-slash command"
+        Args:
+            operation: Function called with each path
+            paths: Files to operate on
+            progress: Progress bar from track_operation
+            task: Task ID within the progress bar
+        """
+        if len(paths) < _PARALLEL_FILE_THRESHOLD:
+            for path in paths:
+                operation(path)
+                progress.update(task, advance=1)
+            return
 
-    def _extract_usage(self, file_path: Path) -> str:
+        with ThreadPoolExecutor(max_workers=min(_MAX_FILE_WORKERS, len(paths))) as pool:
+            futures = [pool.submit(operation, path) for path in paths]
+            for future in as_completed(futures):
+                future.result()
+                progress.update(task, advance=1)
+
+    def _find_commands_directory(self) -> Optional[str]:
+        """Find the commands directory (project or global)."""
+        return _locate_commands_directory(os.getcwd(), os.path.expanduser("~"))
+
+    def _detect_installation(self) -> tuple[Optional[str], str]:
         """
-        Extract usage from markdown file.
+        Detect installation type and location.
+
+        Returns:
+            Tuple of (install_dir, install_type) or (None, "") if not found
+        """
+        return _locate_installation(os.getcwd(), os.path.expanduser("~"))
+
+    def _extract_metadata(self, file_path: Path) -> tuple[str, str]:
+        """
+        Extract command description and usage from markdown file.
+
+        The file is read once and both are found with precompiled patterns
+        rather than a per-line loop.
 
         Args:
             file_path: Path to the markdown command file
 
         Returns:
-            Extracted usage string or empty string
+            Tuple of (description, usage); description falls back to a default
+            text and usage to an empty string
         """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
+        except Exception:
+            return "Custom claude-slash command", ""
 
-            # Look for usage in code blocks
-            lines = content.split("\n")
-            in_code_block = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith("```"):
-                    in_code_block = not in_code_block
-                    continue
-                if in_code_block and line.startswith("/"):
-                    return line
+        description = None
 
-            return ""
+        # Try to get the first line after the title that contains descriptive text
+        lines = content.split("\n", 3)
+        if len(lines) >= 3:
+            line = lines[2].strip()
+            if line and len(line) >= 10:
+                description = line
 
-        except Exception:
-            return ""
+        # If that's empty or too short, look for the Description section
+        if description is None:
+            header = _DESC_HEADER_RE.search(content)
+            if header:
+                match = _DESC_RE.match(content, header.end())
+                if match:
+                    description = match.group(1)[:80]
+
+        match = _USAGE_RE.match(content)
+        usage = match.group(1) if match else None
+
+        return description or "Custom claude-slash command", usage or ""
 
     def _get_timestamp(self) -> str:
         """Get a timestamp string for backup directories."""
@@ -2,14 +2,38 @@
 """
 Generate a professional Perses dashboard mockup for llm-d monitoring.
 Creates a realistic-looking dashboard with sample metrics and data.
+
+The image format follows the output file name: a .svg name is written by
+matplotlib's vector backend, skipping rasterization entirely.
 """
 
+import argparse
+import os
+
+import matplotlib
+# Only files are written, so skip probing for an interactive GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Rectangle, FancyBboxPatch
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from PIL import Image
+from datetime import datetime
+
+parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+parser.add_argument(
+    'output', nargs='?',
+    default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'dashboard-mockup.png'),
+    help='output file (default: dashboard-mockup.png next to this script)')
+parser.add_argument(
+    '--dpi', type=int, default=150,
+    help='raster resolution; 300 gives a print-quality PNG (default: 150)')
+args = parser.parse_args()
+
+# Seeded so repeated runs plot the same sample data
+rng = np.random.default_rng(seed=0)
+
+# Keep SVG text as <text> elements instead of converting glyphs to paths
+plt.rcParams['svg.fonttype'] = 'none'
 
 # Set up the figure with dark theme
 plt.style.use('dark_background')
@@ -37,70 +61,42 @@ metric_red = '#dc3545'
 gs = fig.add_gridspec(6, 5, hspace=0.3, wspace=0.2, 
                       left=0.05, right=0.95, top=0.88, bottom=0.05)
 
+
+def add_stat_panel(cell, title, value, note, value_color, note_color,
+                   title_size=12, value_size=24, value_y=0.4, note_y=0.1):
+    """Add a single-value stat panel in a grid cell and return its axes."""
+    ax = fig.add_subplot(gs[cell])
+    ax.set_facecolor(panel_bg)
+    ax.text(0.5, 0.8, title, ha='center', va='center', 
+            fontsize=title_size, fontweight='bold', color=text_color)
+    ax.text(0.5, value_y, value, ha='center', va='center', 
+            fontsize=value_size, fontweight='bold', color=value_color)
+    ax.text(0.5, note_y, note, ha='center', va='center', 
+            fontsize=10, color=note_color)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+    return ax
+
 # Panel 1: System Overview - Active Models
-ax1 = fig.add_subplot(gs[0, 0])
-ax1.set_facecolor(panel_bg)
-ax1.text(0.5, 0.8, 'Active Models', ha='center', va='center', 
-         fontsize=14, fontweight='bold', color=text_color)
-ax1.text(0.5, 0.4, '12', ha='center', va='center', 
-         fontsize=36, fontweight='bold', color=metric_green)
-ax1.text(0.5, 0.1, '+2 from last hour', ha='center', va='center', 
-         fontsize=10, color=metric_green)
-ax1.set_xlim(0, 1)
-ax1.set_ylim(0, 1)
-ax1.axis('off')
+add_stat_panel((0, 0), 'Active Models', '12', '+2 from last hour',
+               metric_green, metric_green, title_size=14, value_size=36)
 
 # Panel 2: Total RPS
-ax2 = fig.add_subplot(gs[0, 1])
-ax2.set_facecolor(panel_bg)
-ax2.text(0.5, 0.8, 'Requests/sec', ha='center', va='center', 
-         fontsize=14, fontweight='bold', color=text_color)
-ax2.text(0.5, 0.4, '1,247', ha='center', va='center', 
-         fontsize=32, fontweight='bold', color=metric_green)
-ax2.text(0.5, 0.1, '↗ 15% increase', ha='center', va='center', 
-         fontsize=10, color=metric_green)
-ax2.set_xlim(0, 1)
-ax2.set_ylim(0, 1)
-ax2.axis('off')
+add_stat_panel((0, 1), 'Requests/sec', '1,247', '↗ 15% increase',
+               metric_green, metric_green, title_size=14, value_size=32)
 
 # Panel 3: System Uptime
-ax3 = fig.add_subplot(gs[0, 2])
-ax3.set_facecolor(panel_bg)
-ax3.text(0.5, 0.8, 'System Uptime', ha='center', va='center', 
-         fontsize=14, fontweight='bold', color=text_color)
-ax3.text(0.5, 0.4, '99.97%', ha='center', va='center', 
-         fontsize=32, fontweight='bold', color=metric_green)
-ax3.text(0.5, 0.1, '47 days, 13h', ha='center', va='center', 
-         fontsize=10, color='#888888')
-ax3.set_xlim(0, 1)
-ax3.set_ylim(0, 1)
-ax3.axis('off')
+add_stat_panel((0, 2), 'System Uptime', '99.97%', '47 days, 13h',
+               metric_green, '#888888', title_size=14, value_size=32)
 
 # Panel 4: Error Rate
-ax4 = fig.add_subplot(gs[0, 3])
-ax4.set_facecolor(panel_bg)
-ax4.text(0.5, 0.8, 'Error Rate', ha='center', va='center', 
-         fontsize=14, fontweight='bold', color=text_color)
-ax4.text(0.5, 0.4, '0.03%', ha='center', va='center', 
-         fontsize=32, fontweight='bold', color=metric_green)
-ax4.text(0.5, 0.1, 'Within SLO', ha='center', va='center', 
-         fontsize=10, color=metric_green)
-ax4.set_xlim(0, 1)
-ax4.set_ylim(0, 1)
-ax4.axis('off')
+add_stat_panel((0, 3), 'Error Rate', '0.03%', 'Within SLO',
+               metric_green, metric_green, title_size=14, value_size=32)
 
 # Panel 5: GPU Utilization
-ax5 = fig.add_subplot(gs[0, 4])
-ax5.set_facecolor(panel_bg)
-ax5.text(0.5, 0.8, 'GPU Utilization', ha='center', va='center', 
-         fontsize=14, fontweight='bold', color=text_color)
-ax5.text(0.5, 0.4, '78%', ha='center', va='center', 
-         fontsize=32, fontweight='bold', color=metric_yellow)
-ax5.text(0.5, 0.1, '8/10 GPUs active', ha='center', va='center', 
-         fontsize=10, color='#888888')
-ax5.set_xlim(0, 1)
-ax5.set_ylim(0, 1)
-ax5.axis('off')
+add_stat_panel((0, 4), 'GPU Utilization', '78%', '8/10 GPUs active',
+               metric_yellow, '#888888', title_size=14, value_size=32)
 
 # Panel 6: Inference Latency Graph (Large panel spanning 2x2)
 ax6 = fig.add_subplot(gs[1:3, 0:2])
@@ -110,9 +106,10 @@ ax6.set_title('Inference Latency (P50, P95, P99)', fontsize=14,
 
 # Generate sample latency data
 hours = np.arange(0, 24, 0.5)
-p50 = 45 + 10 * np.sin(hours/4) + np.random.normal(0, 2, len(hours))
-p95 = 120 + 20 * np.sin(hours/4) + np.random.normal(0, 5, len(hours))
-p99 = 280 + 40 * np.sin(hours/4) + np.random.normal(0, 10, len(hours))
+noise = rng.standard_normal((3, len(hours)))
+p50 = 45 + 10 * np.sin(hours/4) + 2 * noise[0]
+p95 = 120 + 20 * np.sin(hours/4) + 5 * noise[1]
+p99 = 280 + 40 * np.sin(hours/4) + 10 * noise[2]
 
 ax6.plot(hours, p50, color=metric_green, linewidth=2, label='P50', alpha=0.8)
 ax6.plot(hours, p95, color=metric_yellow, linewidth=2, label='P95', alpha=0.8)
@@ -184,45 +181,19 @@ ax8.set_ylim(-0.4, 0.6)
 ax8.axis('off')
 
 # Panel 9: Queue Depth
-ax9 = fig.add_subplot(gs[1, 4])
-ax9.set_facecolor(panel_bg)
-ax9.text(0.5, 0.8, 'Queue Depth', ha='center', va='center', 
-         fontsize=12, fontweight='bold', color=text_color)
-ax9.text(0.5, 0.4, '23', ha='center', va='center', 
-         fontsize=28, fontweight='bold', color=metric_green)
-ax9.text(0.5, 0.1, 'Avg wait: 45ms', ha='center', va='center', 
-         fontsize=10, color='#888888')
-ax9.set_xlim(0, 1)
-ax9.set_ylim(0, 1)
-ax9.axis('off')
+add_stat_panel((1, 4), 'Queue Depth', '23', 'Avg wait: 45ms',
+               metric_green, '#888888', value_size=28)
 
 # Panel 10: Memory Usage
-ax10 = fig.add_subplot(gs[2, 3])
-ax10.set_facecolor(panel_bg)
-ax10.text(0.5, 0.8, 'Memory Usage', ha='center', va='center', 
-          fontsize=12, fontweight='bold', color=text_color)
-ax10.text(0.5, 0.4, '67%', ha='center', va='center', 
-          fontsize=28, fontweight='bold', color=metric_yellow)
-ax10.text(0.5, 0.1, '42.7GB / 64GB', ha='center', va='center', 
-          fontsize=10, color='#888888')
-ax10.set_xlim(0, 1)
-ax10.set_ylim(0, 1)
-ax10.axis('off')
+add_stat_panel((2, 3), 'Memory Usage', '67%', '42.7GB / 64GB',
+               metric_yellow, '#888888', value_size=28)
 
 # Panel 11: vLLM Engine Status
-ax11 = fig.add_subplot(gs[2, 4])
-ax11.set_facecolor(panel_bg)
-ax11.text(0.5, 0.8, 'vLLM Engines', ha='center', va='center', 
-          fontsize=12, fontweight='bold', color=text_color)
-ax11.text(0.5, 0.5, '✓', ha='center', va='center', 
-          fontsize=32, fontweight='bold', color=metric_green)
-ax11.text(0.5, 0.2, '6/6 Healthy', ha='center', va='center', 
-          fontsize=10, color=metric_green)
+ax11 = add_stat_panel((2, 4), 'vLLM Engines', '✓', '6/6 Healthy',
+                      metric_green, metric_green, value_size=32,
+                      value_y=0.5, note_y=0.2)
 ax11.text(0.5, 0.05, 'v0.2.1', ha='center', va='center', 
           fontsize=8, color='#888888')
-ax11.set_xlim(0, 1)
-ax11.set_ylim(0, 1)
-ax11.axis('off')
 
 # Panel 12: Throughput Over Time (Large panel)
 ax12 = fig.add_subplot(gs[3:5, 0:3])
@@ -233,10 +204,11 @@ ax12.set_title('Throughput Metrics', fontsize=14, fontweight='bold',
 # Generate throughput data
 time_points = np.arange(0, 24, 0.25)
 base_rps = 800 + 400 * np.sin((time_points - 8) * np.pi / 12)  # Daily pattern
-rps = np.maximum(200, base_rps + np.random.normal(0, 50, len(time_points)))
+noise = rng.standard_normal((2, len(time_points)))
+rps = np.maximum(200, base_rps + 50 * noise[0])
 
 base_tps = rps * 45  # ~45 tokens per request average
-tps = base_tps + np.random.normal(0, 1000, len(time_points))
+tps = base_tps + 1000 * noise[1]
 
 ax12_twin = ax12.twinx()
 
@@ -287,56 +259,20 @@ for text in texts:
     text.set_fontsize(10)
 
 # Panel 14: SLA Status
-ax14 = fig.add_subplot(gs[5, 0])
-ax14.set_facecolor(panel_bg)
-ax14.text(0.5, 0.8, 'SLA Status', ha='center', va='center', 
-          fontsize=12, fontweight='bold', color=text_color)
-ax14.text(0.5, 0.45, '✓', ha='center', va='center', 
-          fontsize=24, fontweight='bold', color=metric_green)
-ax14.text(0.5, 0.15, 'All targets met', ha='center', va='center', 
-          fontsize=10, color=metric_green)
-ax14.set_xlim(0, 1)
-ax14.set_ylim(0, 1)
-ax14.axis('off')
+add_stat_panel((5, 0), 'SLA Status', '✓', 'All targets met',
+               metric_green, metric_green, value_y=0.45, note_y=0.15)
 
 # Panel 15: Cost per Token
-ax15 = fig.add_subplot(gs[5, 1])
-ax15.set_facecolor(panel_bg)
-ax15.text(0.5, 0.8, 'Cost/1K Tokens', ha='center', va='center', 
-          fontsize=12, fontweight='bold', color=text_color)
-ax15.text(0.5, 0.4, '$0.0023', ha='center', va='center', 
-          fontsize=24, fontweight='bold', color=metric_green)
-ax15.text(0.5, 0.1, '12% under budget', ha='center', va='center', 
-          fontsize=10, color=metric_green)
-ax15.set_xlim(0, 1)
-ax15.set_ylim(0, 1)
-ax15.axis('off')
+add_stat_panel((5, 1), 'Cost/1K Tokens', '$0.0023', '12% under budget',
+               metric_green, metric_green)
 
 # Panel 16: Load Balancer Health
-ax16 = fig.add_subplot(gs[5, 2])
-ax16.set_facecolor(panel_bg)
-ax16.text(0.5, 0.8, 'Load Balancer', ha='center', va='center', 
-          fontsize=12, fontweight='bold', color=text_color)
-ax16.text(0.5, 0.4, '98.2%', ha='center', va='center', 
-          fontsize=24, fontweight='bold', color=metric_green)
-ax16.text(0.5, 0.1, 'Distribution eff.', ha='center', va='center', 
-          fontsize=10, color='#888888')
-ax16.set_xlim(0, 1)
-ax16.set_ylim(0, 1)
-ax16.axis('off')
+add_stat_panel((5, 2), 'Load Balancer', '98.2%', 'Distribution eff.',
+               metric_green, '#888888')
 
 # Panel 17: MTTR
-ax17 = fig.add_subplot(gs[5, 3])
-ax17.set_facecolor(panel_bg)
-ax17.text(0.5, 0.8, 'MTTR', ha='center', va='center', 
-          fontsize=12, fontweight='bold', color=text_color)
-ax17.text(0.5, 0.4, '2.3m', ha='center', va='center', 
-          fontsize=24, fontweight='bold', color=metric_green)
-ax17.text(0.5, 0.1, 'Target: <5m', ha='center', va='center', 
-          fontsize=10, color=metric_green)
-ax17.set_xlim(0, 1)
-ax17.set_ylim(0, 1)
-ax17.axis('off')
+add_stat_panel((5, 3), 'MTTR', '2.3m', 'Target: <5m',
+               metric_green, metric_green)
 
 # Panel 18: NEW v0.51.1 Table with Pagination
 ax18 = fig.add_subplot(gs[5, 4])
@@ -379,10 +315,13 @@ plt.figtext(0.15, 0.92, 'Datasource: prometheus-llm-d', fontsize=12,
             color='#888888')
 
 plt.tight_layout()
-plt.savefig('/Users/jeder/repos/perses-llm-d/dashboard-mockup.png', 
-            dpi=300, bbox_inches='tight', facecolor='#1a1a1a')
+plt.savefig(args.output, dpi=args.dpi, bbox_inches='tight',
+            facecolor='#1a1a1a')
 plt.close()
 
-print("Dashboard mockup generated successfully: dashboard-mockup.png")
-print("Resolution: 6000x4200 pixels (300 DPI)")
-print("File size: ~2-3MB")
\ No newline at end of file
+print(f"Dashboard mockup generated successfully: {args.output}")
+if not args.output.lower().endswith('.svg'):
+    with Image.open(args.output) as image:
+        width, height = image.size
+    print(f"Resolution: {width}x{height} pixels ({args.dpi} DPI)")
+print(f"File size: {os.path.getsize(args.output) / 1024:.0f}KB")